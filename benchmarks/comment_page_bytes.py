@@ -0,0 +1,94 @@
+"""Bytes read from the database per page of a comment thread.
+
+Compares the lean thread projection (`Comment.objects.for_thread()`) with
+the full `select_related('author', 'post')` rows on a post whose text is
+``--post-text-kb`` kilobytes long::
+
+    python benchmarks/comment_page_bytes.py --post-text-kb 20
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'blogicum'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blogicum.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from blog.models import Category, Comment, Post, User  # noqa: E402
+from core.constants import COMMENTS_PER_PAGE  # noqa: E402
+
+
+def populate(post_text_kb, n_comments):
+    author = User.objects.create_user('bench_author')
+    post = Post.objects.create(
+        title='Длинный пост',
+        text='ж' * post_text_kb * 1024,
+        pub_date=timezone.now() - timedelta(days=1),
+        author=author,
+        category=Category.objects.create(
+            title='Бенчмарк', description='', slug='bench'
+        ),
+    )
+    Comment.objects.bulk_create(
+        Comment(author=author, post=post, text=f'Комментарий {i}')
+        for i in range(n_comments)
+    )
+    return post
+
+
+def row_bytes(queryset):
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    total = sum(
+        len(value.encode()) if isinstance(value, str) else len(str(value))
+        for row in rows
+        for value in row
+        if value is not None
+    )
+    return {
+        'rows': len(rows),
+        'columns': len(rows[0]) if rows else 0,
+        'bytes': total,
+        'bytes_per_comment': round(total / max(len(rows), 1)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--post-text-kb', type=int, default=20)
+    args = parser.parse_args()
+
+    setup_test_environment(debug=False)
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        post = populate(args.post_text_kb, COMMENTS_PER_PAGE)
+        thread = Comment.objects.of_post(post).order_by('created_at', 'pk')
+        results = {
+            'thread': row_bytes(thread.for_thread()[:COMMENTS_PER_PAGE]),
+            'full': row_bytes(thread.with_relations()[:COMMENTS_PER_PAGE]),
+        }
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+    json.dump(
+        {'post_text_kb': args.post_text_kb, 'results': results},
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
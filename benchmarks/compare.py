@@ -0,0 +1,56 @@
+"""Compare two ``benchmarks/endpoints.py`` reports.
+
+Prints the change of every route and exits with status 1 when a route
+runs more queries than before or its p50 latency grew by more than
+``--threshold`` percent::
+
+    python benchmarks/compare.py before.json after.json --threshold 20
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path, encoding='utf-8') as stream:
+        report = json.load(stream)
+    return report, {
+        (row['route'], row['user']): row for row in report['results']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('before')
+    parser.add_argument('after')
+    parser.add_argument('--threshold', type=float, default=20.0)
+    args = parser.parse_args()
+
+    before_report, before = load(args.before)
+    after_report, after = load(args.after)
+    if before_report['data'] != after_report['data']:
+        print('warning: the reports were measured on different data sets')
+
+    regressions = 0
+    print(f'{"route":<28} {"user":<10} {"queries":>9} {"p50 ms":>17}')
+    for key, new in sorted(after.items()):
+        old = before.get(key)
+        if old is None:
+            print(f'{key[0]:<28} {key[1]:<10} {"new route":>27}')
+            continue
+        change = (new['p50_ms'] - old['p50_ms']) / max(old['p50_ms'], 1e-9)
+        slower = change * 100 > args.threshold
+        more_queries = new['queries'] > old['queries']
+        regressions += slower or more_queries
+        print(
+            f'{key[0]:<28} {key[1]:<10}'
+            f' {old["queries"]:>4}→{new["queries"]:<4}'
+            f' {old["p50_ms"]:>7}→{new["p50_ms"]:<7} {change:+.0%}'
+            f'{"  REGRESSION" if slower or more_queries else ""}'
+        )
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""Latency, query-count and memory benchmark of every blog and pages URL.
+
+Fills a throwaway test database with ``datagen.populate`` and requests
+every route of ``blog/urls.py`` and ``pages/urls.py`` through the Django
+test client, as an anonymous visitor and as the author of the sample
+post. Results go to ``--output`` as JSON; compare two runs with
+``benchmarks/compare.py``::
+
+    python benchmarks/endpoints.py --posts 10000 --output bench.json
+
+The full data set of the performance plan is ``--users 100000 --posts
+1000000 --comments 10000000``; generating it takes a while.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'blogicum'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blogicum.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+import datagen  # noqa: E402
+from django.core.cache import cache  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import (  # noqa: E402
+    CaptureQueriesContext,
+    setup_test_environment,
+)
+from django.urls import reverse  # noqa: E402
+from timing import percentiles  # noqa: E402
+
+from blog import urls as blog_urls  # noqa: E402
+from blog.models import Comment  # noqa: E402
+from pages import urls as pages_urls  # noqa: E402
+
+
+def routes(sample, comment):
+    """`(name, url)` of every route, filled in with the sample objects."""
+    values = {
+        'username': sample.author.username,
+        'post_id': sample.pk,
+        'comment_id': comment.pk,
+        'category_slug': sample.category.slug,
+    }
+    for module in (blog_urls, pages_urls):
+        for pattern in module.urlpatterns:
+            name = f'{module.app_name}:{pattern.name}'
+            kwargs = {key: values[key] for key in pattern.pattern.converters}
+            url = reverse(name, kwargs=kwargs)
+            if name == 'blog:search':
+                url += '?q=путешествие'
+            yield name, url
+
+
+def measure(client, url, repeat):
+    cache.clear()
+    started = time.perf_counter()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    cold_ms = (time.perf_counter() - started) * 1000
+    n_queries = len(queries)
+
+    tracemalloc.start()
+    client.get(url)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        client.get(url)
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        'status': response.status_code,
+        'queries': n_queries,
+        'bytes': len(response.content),
+        'cold_ms': round(cold_ms, 2),
+        **percentiles(timings),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=1_000)
+    parser.add_argument('--posts', type=int, default=10_000)
+    parser.add_argument('--comments', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--search-index',
+        action='store_true',
+        help='Build the full-text index too (slow on large data sets).',
+    )
+    parser.add_argument('--output', help='JSON file; stdout by default.')
+    args = parser.parse_args()
+    if args.posts < 1:
+        parser.error('the URLs need a sample post: --posts must be >= 1')
+
+    setup_test_environment(debug=False)
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        started = time.perf_counter()
+        sample = datagen.populate(
+            args.users, args.posts, args.comments, seed=args.seed
+        )
+        if args.search_index:
+            call_command('rebuild_search_index', verbosity=0)
+        generated_s = time.perf_counter() - started
+        comment = Comment.objects.create(
+            post=sample, author=sample.author, text='Комментарий автора'
+        )
+
+        anonymous = Client()
+        author = Client()
+        author.force_login(sample.author)
+        results = [
+            {
+                'route': name,
+                'url': url,
+                'user': user,
+                **measure(client, url, args.repeat),
+            }
+            for name, url in routes(sample, comment)
+            for user, client in (('anonymous', anonymous), ('author', author))
+        ]
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'data': {
+            'users': args.users,
+            'posts': args.posts,
+            'comments': args.comments,
+            'seed': args.seed,
+            'generated_s': round(generated_s, 1),
+        },
+        'repeat': args.repeat,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as stream:
+            json.dump(report, stream, indent=2, ensure_ascii=False)
+    else:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
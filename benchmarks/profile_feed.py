@@ -0,0 +1,100 @@
+"""Latency and query-count benchmark for the profile feed.
+
+Creates a throwaway test database with one author owning ``--posts``
+posts and requests the first, a middle and the last profile page::
+
+    python benchmarks/profile_feed.py --posts 5000 --repeat 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'blogicum'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blogicum.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import (  # noqa: E402
+    CaptureQueriesContext,
+    setup_test_environment,
+)
+from django.utils import timezone  # noqa: E402
+from timing import percentiles  # noqa: E402
+
+from blog.models import Category, Post, User  # noqa: E402
+from core.constants import POSTS_PER_PAGE  # noqa: E402
+
+
+def populate(n_posts):
+    author = User.objects.create_user('bench_author')
+    category = Category.objects.create(
+        title='Бенчмарк', description='', slug='bench'
+    )
+    start = timezone.now() - timedelta(days=1)
+    Post.objects.bulk_create(
+        (
+            Post(
+                title=f'Пост {i}',
+                text='Текст ' * 50,
+                pub_date=start - timedelta(minutes=i),
+                author=author,
+                category=category,
+            )
+            for i in range(n_posts)
+        ),
+        batch_size=1000,
+    )
+    return author
+
+
+def measure(client, url, repeat):
+    with CaptureQueriesContext(connection) as queries:
+        client.get(url)
+    n_queries = len(queries)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get(url)
+        timings.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, (url, response.status_code)
+    return {
+        'url': url,
+        'queries': n_queries,
+        **percentiles(timings),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--posts', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=30)
+    args = parser.parse_args()
+
+    setup_test_environment(debug=False)
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        author = populate(args.posts)
+        last_page = max(1, -(-args.posts // POSTS_PER_PAGE))
+        client = Client()
+        base = f'/profile/{author.username}/'
+        results = [
+            measure(client, f'{base}?page={page}', args.repeat)
+            for page in sorted({1, last_page // 2 or 1, last_page})
+        ]
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+    json.dump({'posts': args.posts, 'results': results}, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+"""Latency summary shared by the benchmark scripts."""
+
+import math
+import statistics
+
+
+def percentiles(timings):
+    """Return the median and the 99th percentile of `timings`, in ms."""
+    timings = sorted(timings)
+    return {
+        'p50_ms': round(statistics.median(timings), 2),
+        'p99_ms': round(timings[math.ceil(len(timings) * 0.99) - 1], 2),
+    }
@@ -1,12 +1,28 @@
+from django import forms
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import Group
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Length, Substr
 
-from blog.models import Category, Location, Post, User
+from blog.models import Category, Comment, Location, Post, User
+from blog.paginators import EstimatedCountPaginator
+from core.constants import ADMIN_TEXT_PREVIEW_LENGTH
 
 admin.site.unregister(User)
 
 
+def _subquery_count(queryset):
+    return Coalesce(
+        Subquery(
+            queryset.values("author")
+            .annotate(total=Count("pk"))
+            .values("total")
+        ),
+        0,
+    )
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     list_display = (
@@ -16,18 +32,49 @@ class UserAdmin(BaseUserAdmin):
         "first_name",
         "last_name",
         "posts_count",
+        "comments_count",
+        "last_post",
     )
     search_fields = ("username", "email")
-    list_filter = ("username", "email")
+    list_filter = ("is_staff", "is_active")
     list_display_links = ("username", "id")
+    show_full_result_count = False
     fieldsets = (
         (None, {"fields": ("username", "email", "password")}),
         ("Личная информация", {"fields": ("first_name", "last_name")}),
     )
 
-    @admin.display(description="Постов у пользователя")
+    def get_queryset(self, request):
+        # Correlated subqueries rather than Count() over joins: they do not
+        # multiply each other, and are only evaluated for the shown page
+        # unless the list is sorted by them.
+        posts = Post.objects.filter(author=OuterRef("pk")).order_by()
+        comments = Comment.objects.filter(author=OuterRef("pk")).order_by()
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                posts_total=_subquery_count(posts),
+                comments_total=_subquery_count(comments),
+                last_post_date=Subquery(
+                    posts.values("author")
+                    .annotate(last=Max("pub_date"))
+                    .values("last")
+                ),
+            )
+        )
+
+    @admin.display(description="Постов у пользователя", ordering="posts_total")
     def posts_count(self, obj):
-        return obj.posts.count()
+        return obj.posts_total
+
+    @admin.display(description="Комментариев", ordering="comments_total")
+    def comments_count(self, obj):
+        return obj.comments_total
+
+    @admin.display(description="Последний пост", ordering="last_post_date")
+    def last_post(self, obj):
+        return obj.last_post_date
 
 
 @admin.register(Post)
@@ -37,7 +84,7 @@ class PostAdmin(admin.ModelAdmin):
         "id",
         "title",
         "author",
-        "text",
+        "text_preview",
         "category",
         "pub_date",
         "location",
@@ -47,8 +94,49 @@ class PostAdmin(admin.ModelAdmin):
     list_display_links = ("title",)
     list_editable = ("category", "is_published", "location")
     list_filter = ("created_at",)
+    autocomplete_fields = ("author", "category", "location")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     empty_value_display = "-пусто-"
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .defer("text")
+            .annotate(
+                text_start=Substr("text", 1, ADMIN_TEXT_PREVIEW_LENGTH),
+                text_length=Length("text"),
+            )
+        )
+
+    @admin.display(description="Текст")
+    def text_preview(self, obj):
+        if obj.text_length > ADMIN_TEXT_PREVIEW_LENGTH:
+            return f"{obj.text_start}…"
+        return obj.text_start
+
+    def get_changelist_formset(self, request, **kwargs):
+        request.shared_choices = {}
+        return super().get_changelist_formset(request, **kwargs)
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # Rows of the changelist share one list of choices per field
+        # instead of querying the whole table for every <select>.
+        shared = getattr(request, "shared_choices", None)
+        if shared is None or db_field.name not in self.list_editable:
+            return super().formfield_for_foreignkey(
+                db_field, request, **kwargs
+            )
+        kwargs.setdefault("widget", forms.Select)
+        formfield = super().formfield_for_foreignkey(
+            db_field, request, **kwargs
+        )
+        if db_field.name not in shared:
+            shared[db_field.name] = list(formfield.choices)
+        formfield.choices = shared[db_field.name]
+        return formfield
+
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
@@ -75,4 +163,17 @@ class LocationAdmin(admin.ModelAdmin):
     empty_value_display = "-пусто-"
 
 
+@admin.register(Comment)
+class CommentAdmin(admin.ModelAdmin):
+    search_fields = ("text",)
+    list_display = ("pk", "__str__", "author", "post", "is_published")
+    list_editable = ("is_published",)
+    list_filter = ("created_at",)
+    raw_id_fields = ("author", "post")
+    empty_value_display = "-пусто-"
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_relations()
+
+
 admin.site.unregister(Group)
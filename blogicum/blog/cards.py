@@ -0,0 +1,69 @@
+"""Cache of rendered `includes/post_card.html` fragments.
+
+A card depends on its post, category, location and author, so its cache key
+carries a version stamp for each of them plus a global one. Signal handlers
+in blog.signals bump the stamps, which makes the old fragments unreachable
+instead of deleting them one by one. Cards rendered from replica reads
+are shown but not stored. The stamps live in the Django cache, so a bump
+in one process retires the cards of the others only if the backend is
+shared (not the default per-process LocMemCache).
+"""
+
+import time
+
+from django.core.cache import cache
+from django.template.loader import render_to_string
+
+from core.constants import POST_CARD_CACHE_TIMEOUT
+from core.routers import reading_replica
+
+VERSION_KEY = 'blog:card_version:{scope}:{pk}'
+CARD_KEY = 'blog:post_card:{pk}:{version}'
+ALL_CARDS = ('all', 0)
+
+
+def bump_card_version(scope, pk=0):
+    cache.set(VERSION_KEY.format(scope=scope, pk=pk), time.time_ns(), None)
+
+
+def forget_all_cards():
+    bump_card_version(*ALL_CARDS)
+
+
+def _dependencies(post):
+    return (
+        ALL_CARDS,
+        ('post', post.pk),
+        ('category', post.category_id),
+        ('location', post.location_id),
+        ('user', post.author_id),
+    )
+
+
+def attach_card_versions(posts):
+    posts = list(posts)
+    keys = {
+        VERSION_KEY.format(scope=scope, pk=pk)
+        for post in posts
+        for scope, pk in _dependencies(post)
+    }
+    versions = cache.get_many(keys)
+    for post in posts:
+        post.card_version = '-'.join(
+            str(versions.get(VERSION_KEY.format(scope=scope, pk=pk), 0))
+            for scope, pk in _dependencies(post)
+        )
+    return posts
+
+
+def render_post_card(post):
+    if not hasattr(post, 'card_version'):
+        attach_card_versions([post])
+    key = CARD_KEY.format(pk=post.pk, version=post.card_version)
+    html = cache.get(key)
+    if html is None:
+        html = render_to_string('includes/post_card.html', {'post': post})
+        # A replica row may predate the version stamps in the key.
+        if not reading_replica():
+            cache.set(key, html, POST_CARD_CACHE_TIMEOUT)
+    return html
@@ -0,0 +1,82 @@
+"""Publication clock used by the public post querysets.
+
+Rounding "now" down to `BLOG_PUBLICATION_CLOCK_BUCKET` seconds makes every
+request within a bucket produce the same SQL, which lets query and page
+caches reuse results. Delayed posts must still appear on time, so the clock
+falls back to the exact time while a scheduled `pub_date` lies between the
+bucket start and now.
+"""
+
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+NEXT_PUB_DATE_CACHE_KEY = 'blog:clock:next_pub_date'
+
+
+def bucket_seconds():
+    return settings.BLOG_PUBLICATION_CLOCK_BUCKET
+
+
+def bucket_start(moment, seconds):
+    timestamp = moment.timestamp()
+    return datetime.fromtimestamp(
+        timestamp - timestamp % seconds, tz=dt_timezone.utc
+    )
+
+
+def next_scheduled_pub_date(since):
+    """Return the earliest published `pub_date` from `since` on, cached.
+
+    The cached value is keyed on `since` and expires with the bucket, and
+    `forget_scheduled_pub_date` drops it whenever a post changes.
+    """
+    cached = cache.get(NEXT_PUB_DATE_CACHE_KEY)
+    if cached is not None and cached[0] == since:
+        return cached[1]
+
+    from blog.models import Post
+
+    upcoming = (
+        Post.objects.filter(is_published=True, pub_date__gte=since)
+        .order_by('pub_date')
+        .values_list('pub_date', flat=True)
+        .first()
+    )
+    timeout = bucket_seconds() or None
+    if upcoming is not None and upcoming > timezone.now():
+        until_upcoming = (upcoming - timezone.now()).total_seconds()
+        timeout = max(1, min(timeout or until_upcoming, until_upcoming))
+    cache.set(NEXT_PUB_DATE_CACHE_KEY, (since, upcoming), timeout)
+    return upcoming
+
+
+def forget_scheduled_pub_date():
+    cache.delete(NEXT_PUB_DATE_CACHE_KEY)
+
+
+def seconds_until_next_publication(default=None):
+    """Seconds until the next delayed post goes public, for cache timeouts."""
+    current = timezone.now()
+    upcoming = next_scheduled_pub_date(
+        bucket_start(current, bucket_seconds() or 1)
+    )
+    if upcoming is None or upcoming <= current:
+        return default
+    seconds = (upcoming - current).total_seconds()
+    return seconds if default is None else min(default, seconds)
+
+
+def publication_now():
+    current = timezone.now()
+    seconds = bucket_seconds()
+    if not seconds:
+        return current
+    start = bucket_start(current, seconds)
+    upcoming = next_scheduled_pub_date(start)
+    if upcoming is not None and upcoming <= current:
+        return current
+    return start
@@ -0,0 +1,103 @@
+"""Streaming reading and writing of Django's JSON fixture format.
+
+`loaddata` parses a whole fixture into memory before saving anything;
+`iter_objects` decodes one object at a time from a buffered stream, so
+memory use depends on the largest object, not on the file. It also reads
+newline-delimited JSON: a stream that does not start with `[` is taken as
+a sequence of objects. `FixtureWriter` writes either format one object at
+a time.
+"""
+
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+READ_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class _Reader:
+    def __init__(self, stream, read_size):
+        self.stream = stream
+        self.read_size = read_size
+        self.buffer = ''
+        self.position = 0
+        self.eof = False
+
+    def fill(self):
+        chunk = self.stream.read(self.read_size)
+        position, self.position = self.position, 0
+        self.buffer = self.buffer[position:] + chunk
+        self.eof = not chunk
+
+    def peek(self, skipped):
+        """The next significant character, or '' at the end of the stream."""
+        while True:
+            while (
+                self.position < len(self.buffer)
+                and self.buffer[self.position] in skipped
+            ):
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if self.eof:
+                return ''
+            self.fill()
+
+    def decode(self):
+        while True:
+            try:
+                obj, self.position = _decoder.raw_decode(
+                    self.buffer, self.position
+                )
+                return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self.fill()
+
+
+def iter_objects(stream, read_size=READ_SIZE):
+    reader = _Reader(stream, read_size)
+    in_array = reader.peek(_WHITESPACE) == '['
+    if in_array:
+        reader.position += 1
+    while True:
+        char = reader.peek(_WHITESPACE + ',')
+        if in_array and char == ']':
+            return
+        if not char:
+            if in_array:
+                raise json.JSONDecodeError(
+                    'Unterminated array', reader.buffer, reader.position
+                )
+            return
+        yield reader.decode()
+
+
+class FixtureWriter:
+    """Write fixture objects as a `db.json` array or as NDJSON lines."""
+
+    def __init__(self, stream, ndjson=False):
+        self.stream = stream
+        self.ndjson = ndjson
+        self.count = 0
+
+    def __enter__(self):
+        if not self.ndjson:
+            self.stream.write('[')
+        return self
+
+    def write(self, obj):
+        line = json.dumps(obj, cls=DjangoJSONEncoder, ensure_ascii=False)
+        if self.ndjson:
+            self.stream.write(f'{line}\n')
+        else:
+            self.stream.write(f'{"," if self.count else ""}\n{line}')
+        self.count += 1
+
+    def __exit__(self, *exc_info):
+        if not self.ndjson:
+            self.stream.write('\n]\n' if self.count else ']\n')
@@ -1,8 +1,52 @@
 from django import forms
+from django.forms.models import ModelChoiceIterator
 
+from blog import lookups
 from blog.models import Comment, Post
 
 
+class LookupChoiceIterator(ModelChoiceIterator):
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ('', self.field.empty_label)
+        for obj in lookups.rows(self.queryset.model):
+            yield self.choice(obj)
+
+    def __len__(self):
+        return len(lookups.rows(self.queryset.model)) + (
+            1 if self.field.empty_label is not None else 0
+        )
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(
+            lookups.rows(self.queryset.model)
+        )
+
+
+class LookupChoiceField(forms.ModelChoiceField):
+    """Choice of a row of a table cached by blog.lookups, without queries."""
+
+    iterator = LookupChoiceIterator
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        model = self.queryset.model
+        if isinstance(value, model):
+            value = value.pk
+        try:
+            obj = lookups.get(model, pk=model._meta.pk.to_python(value))
+        except forms.ValidationError:
+            obj = None
+        if obj is None:
+            raise forms.ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice',
+                params={'value': value},
+            )
+        return obj
+
+
 class PostForm(forms.ModelForm):
     class Meta:
         model = Post
@@ -15,6 +59,10 @@ class PostForm(forms.ModelForm):
             'category',
             'image',
         )
+        field_classes = {
+            'location': LookupChoiceField,
+            'category': LookupChoiceField,
+        }
         widgets = {
             'pub_date': forms.DateTimeInput(
                 attrs={'type': 'datetime-local'}, format='%Y-%m-%dT%H:%M:%S'
@@ -0,0 +1,70 @@
+"""Database-backed queue of uploaded images waiting to be processed.
+
+Saving a post with a new image only stores the upload and queues an
+`ImageJob`; the post shows a placeholder meanwhile, so upload latency does
+not depend on the image size. `manage.py process_image_jobs` is the worker:
+it claims jobs with a conditional UPDATE, so any number of workers can run
+next to the web server without a message broker.
+"""
+
+import traceback
+from datetime import timedelta
+
+from django.utils import timezone
+
+from blog import thumbnails
+from blog.cards import bump_card_version
+from blog.models import ImageJob, Post
+from blog.page_cache import forget_anonymous_pages
+from core.constants import IMAGE_JOB_MAX_ATTEMPTS, IMAGE_JOB_TIMEOUT
+
+
+def enqueue(post):
+    return ImageJob.objects.create(post=post, image=post.image.name)
+
+
+def _image_ready(job):
+    # Only the job for the image the post still has may reveal it.
+    Post.objects.filter(pk=job.post_id, image=job.image).update(
+        image_ready=True
+    )
+    bump_card_version('post', job.post_id)
+    forget_anonymous_pages()
+
+
+def process(job, storage=None):
+    """Strip metadata and write variants of the job's image.
+
+    After the last failed attempt the original is shown without variants,
+    but only if its metadata (camera, GPS) was stripped; otherwise the
+    post keeps the placeholder.
+    """
+    storage = storage or job.post.image.storage
+    stripped = False
+    try:
+        thumbnails.strip_metadata(job.image, storage)
+        stripped = True
+        thumbnails.generate_thumbnails(job.image, storage)
+    except Exception:
+        job.error = traceback.format_exc()
+        if job.attempts < IMAGE_JOB_MAX_ATTEMPTS:
+            job.status = ImageJob.Status.PENDING
+            job.save(update_fields=('status', 'error'))
+            return job
+        job.status = ImageJob.Status.FAILED
+    else:
+        job.status = ImageJob.Status.DONE
+        job.error = ''
+    job.finished_at = timezone.now()
+    job.save(update_fields=('status', 'error', 'finished_at'))
+    if stripped:
+        _image_ready(job)
+    return job
+
+
+def process_next():
+    """Claim and process one job; returns it, or None if the queue is empty."""
+    job = ImageJob.objects.claim(
+        stale_after=timedelta(seconds=IMAGE_JOB_TIMEOUT)
+    )
+    return job and process(job)
@@ -0,0 +1,112 @@
+"""Cached lookups of the category and location tables.
+
+Both tables are small and change rarely, yet category pages and every post
+form read them. Each table is cached whole, in two tiers: in the Django
+cache under a version stamp, and in a per-process dict that is reused for
+as long as the stamp stays the same, so a warm lookup costs one cache read
+and no query. Signal handlers in blog.signals bump the stamp on save and
+delete; updates that bypass signals must call `forget_lookups`. Tables are
+always loaded from `default`: a lagging replica would cache old rows under
+the new stamp.
+
+A bump reaches other processes only through the cache backend, so it must
+be shared between them, as the one of `blogicum.settings_production` is.
+With the default in-process LocMemCache every worker keeps its own stamp
+and may serve rows another worker has changed until it restarts.
+"""
+
+import copy
+import time
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from blog.models import Category
+from core.constants import LOOKUP_CACHE_TIMEOUT
+
+VERSION_KEY = 'blog:lookup_version:{table}'
+TABLE_KEY = 'blog:lookup:{table}:{version}'
+# Fields that rows can be looked up by, per model label.
+LOOKUP_FIELDS = {
+    'blog.category': ('pk', 'slug'),
+    'blog.location': ('pk',),
+}
+
+# model label -> (version, rows, {field: {value: row}})
+_local = {}
+
+
+def _table(model):
+    return model._meta.label_lower
+
+
+def _bump(table):
+    cache.set(VERSION_KEY.format(table=table), time.time_ns(), None)
+
+
+def forget_lookups(model):
+    """Invalidate the cached table of `model` in every process that shares
+    the cache backend.
+
+    The stamp is bumped again on commit: another process may have loaded
+    the old rows under the first new stamp before the transaction
+    committed.
+    """
+    table = _table(model)
+    _bump(table)
+    transaction.on_commit(lambda: _bump(table))
+
+
+def _current_version(table):
+    version = cache.get(VERSION_KEY.format(table=table))
+    if version is None:
+        # Evicted or never set: nothing cached so far can be trusted.
+        _bump(table)
+        version = cache.get(VERSION_KEY.format(table=table))
+    return version
+
+
+def _load(model):
+    table = _table(model)
+    version = _current_version(table)
+    local = _local.get(table)
+    if local is not None and local[0] == version:
+        return local
+    key = TABLE_KEY.format(table=table, version=version)
+    rows = cache.get(key)
+    if rows is None:
+        rows = tuple(model._default_manager.using(DEFAULT_DB_ALIAS))
+        cache.set(key, rows, LOOKUP_CACHE_TIMEOUT)
+    local = (
+        version,
+        rows,
+        {
+            field: {getattr(row, field): row for row in rows}
+            for field in LOOKUP_FIELDS[table]
+        },
+    )
+    _local[table] = local
+    return local
+
+
+def rows(model):
+    """Every row of `model` in its default ordering; do not modify them."""
+    return _load(model)[1]
+
+
+def get(model, **lookup):
+    """Return a copy of the row with `field=value`, or None.
+
+    Only one field of `LOOKUP_FIELDS` is accepted, e.g. `get(Category,
+    slug='travel')`.
+    """
+    ((field, value),) = lookup.items()
+    row = _load(model)[2][field].get(value)
+    return copy.copy(row) if row is not None else None
+
+
+def public_category(slug):
+    category = get(Category, slug=slug)
+    if category is None or not category.is_published:
+        return None
+    return category
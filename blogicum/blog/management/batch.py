@@ -0,0 +1,122 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+
+from blog.models import BatchJobCheckpoint
+
+
+class BatchCommand(BaseCommand):
+    """Base command for jobs that walk a table in primary-key order.
+
+    Subclasses set `model` (or override `get_queryset`) and implement
+    `process_batch`. Rows are fetched `--batch-size` at a time with a
+    `pk > last_pk` seek, so memory stays bounded and deep batches cost the
+    same as the first one. Each batch and its checkpoint commit together:
+    a job that crashes resumes after the last committed batch when run
+    again, and `--restart` starts it over. `--database` picks the alias
+    that holds both the rows and the checkpoint (`self.using`).
+    """
+
+    model = None
+    batch_size = 1000
+    job_name = None
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=self.batch_size,
+            help='Сколько строк обрабатывать в одной транзакции.',
+        )
+        parser.add_argument(
+            '--rows-per-second',
+            type=float,
+            default=0,
+            help='Ограничение скорости; 0 — без ограничения.',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Начать заново, не продолжая с контрольной точки.',
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help='База данных для обработки.',
+        )
+
+    def get_job_name(self):
+        return self.job_name or self.__module__.rsplit('.', 1)[-1]
+
+    def get_queryset(self):
+        return self.model._base_manager.using(self.using)
+
+    def process_batch(self, batch):
+        raise NotImplementedError(
+            'BatchCommand.process_batch is not implemented'
+        )
+
+    def on_start(self, checkpoint):
+        """Hook called before the first batch of a fresh (not resumed) run."""
+
+    def handle(
+        self, *args, batch_size, rows_per_second, restart, database, **options
+    ):
+        self.using = database
+        checkpoint, _ = BatchJobCheckpoint.objects.using(
+            database
+        ).get_or_create(name=self.get_job_name())
+        if restart or checkpoint.finished_at:
+            checkpoint.last_pk = checkpoint.processed = 0
+            checkpoint.finished_at = None
+        if checkpoint.last_pk == 0:
+            checkpoint.started_at = timezone.now()
+            self.on_start(checkpoint)
+        elif options['verbosity']:
+            self.stdout.write(
+                f'Продолжаем с id > {checkpoint.last_pk}, '
+                f'уже обработано {checkpoint.processed}.'
+            )
+        checkpoint.save()
+
+        queryset = self.get_queryset().order_by('pk')
+        started = time.monotonic()
+        run_processed = 0
+        while True:
+            batch = list(
+                queryset.filter(pk__gt=checkpoint.last_pk)[:batch_size]
+            )
+            if not batch:
+                break
+            with transaction.atomic(using=database):
+                self.process_batch(batch)
+                checkpoint.last_pk = batch[-1].pk
+                checkpoint.processed += len(batch)
+                checkpoint.save(update_fields=('last_pk', 'processed'))
+            run_processed += len(batch)
+            self.throttle(run_processed, started, rows_per_second)
+            if options['verbosity'] > 1:
+                self.report(checkpoint, run_processed, started)
+
+        checkpoint.finished_at = timezone.now()
+        checkpoint.save(update_fields=('finished_at', 'updated_at'))
+        if options['verbosity']:
+            self.report(checkpoint, run_processed, started, final=True)
+
+    def throttle(self, processed, started, rows_per_second):
+        if rows_per_second <= 0:
+            return
+        ahead = processed / rows_per_second - (time.monotonic() - started)
+        if ahead > 0:
+            time.sleep(ahead)
+
+    def report(self, checkpoint, processed, started, final=False):
+        elapsed = max(time.monotonic() - started, 1e-9)
+        message = (
+            f'{checkpoint.name}: {processed} строк за {elapsed:.1f} с '
+            f'({processed / elapsed:.0f} строк/с), id ≤ {checkpoint.last_pk}'
+        )
+        style = self.style.SUCCESS if final else self.style.HTTP_INFO
+        self.stdout.write(style(message))
@@ -0,0 +1,96 @@
+from contextlib import ExitStack
+from datetime import datetime, time
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers import python
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from blog.fixture_stream import FixtureWriter
+from blog.models import Category, Comment, Location, Post
+
+# The order import_blog loads them in.
+EXPORT_MODELS = (Category, Location, Post, Comment)
+
+
+def parse_since(value):
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise CommandError(
+                f'Не удалось разобрать дату «{value}»; ожидается ISO 8601.'
+            )
+        moment = datetime.combine(day, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+class Command(BaseCommand):
+    help = (
+        'Потоково выгружает категории, местоположения, публикации и'
+        ' комментарии в формате db.json или NDJSON.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-o',
+            '--output',
+            default='-',
+            help='Файл для выгрузки; по умолчанию — стандартный вывод.',
+        )
+        parser.add_argument(
+            '--format',
+            choices=('json', 'ndjson'),
+            default='json',
+            help='json — формат db.json, ndjson — объект на строку.',
+        )
+        parser.add_argument(
+            '--since',
+            type=parse_since,
+            help='Выгрузить только объекты, созданные начиная с этой даты'
+            ' (поле created_at).',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=2000,
+            help='Сколько строк читать из базы за один раз.',
+        )
+        parser.add_argument(
+            '--database',
+            default=DEFAULT_DB_ALIAS,
+            help='База данных для выгрузки.',
+        )
+
+    def handle(
+        self, *args, output, format, since, chunk_size, database, **options
+    ):
+        with ExitStack() as stack:
+            if output == '-':
+                stream = self.stdout
+                # The writer ends its own lines.
+                stream.ending = ''
+            else:
+                stream = stack.enter_context(
+                    open(output, 'w', encoding='utf-8')
+                )
+            writer = stack.enter_context(
+                FixtureWriter(stream, ndjson=format == 'ndjson')
+            )
+            for model in EXPORT_MODELS:
+                queryset = model._base_manager.using(database).order_by('pk')
+                if since:
+                    queryset = queryset.filter(created_at__gte=since)
+                rows = queryset.iterator(chunk_size=chunk_size)
+                # Serializing a chunk at a time keeps memory flat.
+                while chunk := list(islice(rows, chunk_size)):
+                    for obj in python.Serializer().serialize(chunk):
+                        writer.write(obj)
+        if options['verbosity'] and output != '-':
+            self.stdout.write(
+                self.style.SUCCESS(f'Выгружено объектов: {writer.count}')
+            )
@@ -0,0 +1,56 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from blog import thumbnails
+from blog.cards import forget_all_cards
+from blog.management.batch import BatchCommand
+from blog.models import Post
+
+
+def _backfill(name):
+    try:
+        return thumbnails.ensure_thumbnails(name)
+    except OSError:
+        return 0
+
+
+class Command(BatchCommand):
+    help = 'Создаёт уменьшенные копии изображений публикаций.'
+    model = Post
+    batch_size = 100
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count(),
+            help='Число процессов; 1 — обрабатывать в текущем процессе.',
+        )
+
+    def get_queryset(self):
+        return (
+            Post._base_manager.using(self.using)
+            .exclude(image='')
+            .only('image')
+        )
+
+    def process_batch(self, batch):
+        names = [post.image.name for post in batch]
+        mapper = self.pool.map if self.pool else map
+        self.generated += sum(mapper(_backfill, names))
+
+    def handle(self, *args, workers, **options):
+        self.generated = 0
+        self.pool = ProcessPoolExecutor(workers) if workers > 1 else None
+        try:
+            super().handle(*args, **options)
+        finally:
+            if self.pool:
+                self.pool.shutdown()
+        if self.generated:
+            forget_all_cards()
+        if options['verbosity']:
+            self.stdout.write(
+                self.style.SUCCESS(f'Создано файлов: {self.generated}')
+            )
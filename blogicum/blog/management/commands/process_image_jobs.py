@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog import image_jobs
+from core.constants import IMAGE_JOB_POLL_INTERVAL
+
+
+class Command(BaseCommand):
+    help = (
+        'Фоновый обработчик загруженных изображений: удаляет EXIF, создаёт'
+        ' уменьшенные копии и версии в современных форматах.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Обработать очередь и выйти, не дожидаясь новых задач.',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=IMAGE_JOB_POLL_INTERVAL,
+            help='Пауза между проверками пустой очереди, в секундах.',
+        )
+
+    def handle(self, *args, once=False, poll_interval, **options):
+        while True:
+            job = image_jobs.process_next()
+            if job is None:
+                if once:
+                    return
+                time.sleep(poll_interval)
+                continue
+            if options['verbosity']:
+                self.stdout.write(f'{job.image}: {job.get_status_display()}')
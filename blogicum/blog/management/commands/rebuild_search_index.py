@@ -0,0 +1,42 @@
+from django.db import connections
+
+from blog import search
+from blog.management.batch import BatchCommand
+from blog.models import Post
+
+
+class Command(BatchCommand):
+    help = 'Перестраивает полнотекстовый индекс публикаций.'
+    model = Post
+
+    def get_queryset(self):
+        return (
+            Post._base_manager.using(self.using)
+            .select_related('category')
+            .only('title', 'text', 'category__title')
+        )
+
+    def on_start(self, checkpoint):
+        search.clear_index(connections[self.using])
+
+    def process_batch(self, batch):
+        search.index_rows(
+            [
+                (
+                    post.pk,
+                    post.title,
+                    post.text,
+                    post.category.title if post.category else '',
+                )
+                for post in batch
+            ],
+            using=connections[self.using],
+        )
+
+    def handle(self, *args, **options):
+        if not search.is_supported(connections[options['database']]):
+            self.stdout.write(
+                self.style.WARNING('Индекс используется только с SQLite.')
+            )
+            return
+        super().handle(*args, **options)
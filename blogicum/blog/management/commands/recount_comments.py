@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from blog.cards import forget_all_cards
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает сохранённое число комментариев у публикаций.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Только показать число расхождений, ничего не меняя.',
+        )
+
+    def handle(self, *args, dry_run=False, **options):
+        with transaction.atomic():
+            repaired = Post.objects.recount_comments()
+            if dry_run:
+                transaction.set_rollback(True)
+        if repaired and not dry_run:
+            forget_all_cards()
+        verb = 'Найдено расхождений' if dry_run else 'Исправлено публикаций'
+        self.stdout.write(self.style.SUCCESS(f'{verb}: {repaired}'))
@@ -1,6 +1,11 @@
 from django.db import models
 
-from blog.querysets import CategoryQuerySet, CommentQuerySet, PostQuerySet
+from blog.querysets import (
+    CategoryQuerySet,
+    CommentQuerySet,
+    ImageJobQuerySet,
+    PostQuerySet,
+)
 
 
 class PostManager(models.Manager.from_queryset(PostQuerySet)):
@@ -12,11 +17,13 @@ class PostManager(models.Manager.from_queryset(PostQuerySet)):
 
 class CommentManager(models.Manager.from_queryset(CommentQuerySet)):
     def get_queryset(self):
-        return CommentQuerySet(self.model, using=self._db).select_related(
-            'author', 'post'
-        )
+        return CommentQuerySet(self.model, using=self._db)
 
 
 class CategoryManager(models.Manager.from_queryset(CategoryQuerySet)):
     def get_queryset(self):
         return CategoryQuerySet(self.model, using=self._db)
+
+
+class ImageJobManager(models.Manager.from_queryset(ImageJobQuerySet)):
+    pass
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.1 on 2026-10-18 06:14
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def fill_comment_count(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    Comment = apps.get_model('blog', 'Comment')
+    Post.objects.update(
+        comment_count=Coalesce(
+            models.Subquery(
+                Comment.objects.filter(
+                    post=models.OuterRef('pk'), is_published=True
+                )
+                .order_by()
+                .values('post')
+                .annotate(total=models.Count('pk'))
+                .values('total')
+            ),
+            0,
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_alter_comment_options_comment_is_published_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comment_count',
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text='Считается автоматически по опубликованным комментариям.',
+                verbose_name='Количество комментариев',
+            ),
+        ),
+        migrations.RunPython(fill_comment_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.1 on 2026-10-18 06:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_post_comment_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(
+                fields=['post', 'created_at'], name='comment_post_thread_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(
+                condition=models.Q(('is_published', True)),
+                fields=['pub_date', 'id'],
+                name='post_public_feed_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(
+                condition=models.Q(('is_published', True)),
+                fields=['category', 'pub_date', 'id'],
+                name='post_category_feed_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(
+                fields=['author', 'pub_date', 'id'],
+                name='post_author_feed_idx',
+            ),
+        ),
+    ]
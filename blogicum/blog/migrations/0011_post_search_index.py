@@ -0,0 +1,62 @@
+import re
+
+from django.db import migrations
+
+try:
+    import snowballstemmer
+except ImportError:  # pragma: no cover
+    snowballstemmer = None
+
+# Frozen copy of blog.search as of this migration: later changes to the
+# live module must come with a migration of their own.
+SEARCH_TABLE = 'blog_post_search'
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def stem_text(stemmer, text):
+    words = WORD_RE.findall((text or '').lower().replace('ё', 'е'))
+    return ' '.join(stemmer.stemWords(words) if stemmer else words)
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} '
+        'USING fts5(title, text, category, tokenize = "unicode61")'
+    )
+    stemmer = snowballstemmer and snowballstemmer.stemmer('russian')
+    Post = apps.get_model('blog', 'Post')
+    rows = Post.objects.using(schema_editor.connection.alias).values_list(
+        'pk', 'title', 'text', 'category__title'
+    )
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, title, text, category) '
+            'VALUES (%s, %s, %s, %s)',
+            [
+                (
+                    pk,
+                    stem_text(stemmer, title),
+                    stem_text(stemmer, text),
+                    stem_text(stemmer, category),
+                )
+                for pk, title, text, category in rows
+            ],
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.1.1 on 2026-10-18 06:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_post_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BatchJobCheckpoint',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'name',
+                    models.CharField(
+                        max_length=256, unique=True, verbose_name='Задача'
+                    ),
+                ),
+                (
+                    'last_pk',
+                    models.BigIntegerField(
+                        default=0, verbose_name='Последний обработанный id'
+                    ),
+                ),
+                (
+                    'processed',
+                    models.BigIntegerField(
+                        default=0, verbose_name='Обработано строк'
+                    ),
+                ),
+                (
+                    'started_at',
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name='Начата'
+                    ),
+                ),
+                (
+                    'updated_at',
+                    models.DateTimeField(
+                        auto_now=True, verbose_name='Обновлена'
+                    ),
+                ),
+                (
+                    'finished_at',
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name='Завершена'
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'контрольная точка пакетной задачи',
+                'verbose_name_plural': 'Контрольные точки пакетных задач',
+            },
+        ),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 5.1.1 on 2026-10-18 06:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0012_batchjobcheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='image_ready',
+            field=models.BooleanField(
+                default=True,
+                editable=False,
+                help_text='Пока загруженное изображение обрабатывается, вместо него показывается заглушка.',
+                verbose_name='Изображение обработано',
+            ),
+        ),
+        migrations.CreateModel(
+            name='ImageJob',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'image',
+                    models.CharField(max_length=256, verbose_name='Файл'),
+                ),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[
+                            ('pending', 'В очереди'),
+                            ('running', 'Обрабатывается'),
+                            ('done', 'Готово'),
+                            ('failed', 'Ошибка'),
+                        ],
+                        default='pending',
+                        max_length=16,
+                        verbose_name='Состояние',
+                    ),
+                ),
+                (
+                    'attempts',
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name='Попыток'
+                    ),
+                ),
+                (
+                    'error',
+                    models.TextField(
+                        blank=True, verbose_name='Последняя ошибка'
+                    ),
+                ),
+                (
+                    'created_at',
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name='Добавлена'
+                    ),
+                ),
+                (
+                    'started_at',
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name='Начата'
+                    ),
+                ),
+                (
+                    'finished_at',
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name='Завершена'
+                    ),
+                ),
+                (
+                    'post',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to='blog.post',
+                        verbose_name='Публикация',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'обработка изображения',
+                'verbose_name_plural': 'Очередь обработки изображений',
+                'default_related_name': 'image_jobs',
+                'indexes': [
+                    models.Index(
+                        fields=['status', 'id'], name='image_job_queue_idx'
+                    )
+                ],
+            },
+        ),
+    ]
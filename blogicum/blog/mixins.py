@@ -1,12 +1,47 @@
+from django.conf import settings
 from django.contrib.auth.mixins import UserPassesTestMixin
+from django.core.cache import cache
 from django.core.paginator import Paginator
+from django.db import models
 from django.shortcuts import redirect
 from django.urls import reverse
 
+from blog.cards import attach_card_versions
+from blog.page_cache import (
+    anonymous_page_key,
+    cache_anonymous_page,
+    is_cacheable,
+)
+from blog.paginators import KeysetPaginator
+from core.routers import allow_replica_reads
+
 
 class UserIsAuthorMixin(UserPassesTestMixin):
+    # The object is fetched once per request with the ownership check
+    # computed by the database, then reused by UpdateView/DeleteView.
+    _object = None
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .annotate(
+                user_is_author=models.ExpressionWrapper(
+                    models.Q(author_id=self.request.user.pk),
+                    output_field=models.BooleanField(),
+                )
+            )
+        )
+
+    def get_object(self, queryset=None):
+        if queryset is not None:
+            return super().get_object(queryset)
+        if self._object is None:
+            self._object = super().get_object()
+        return self._object
+
     def test_func(self):
-        return self.request.user == self.get_object().author
+        return self.get_object().user_is_author
 
 
 class SuccessUrlArgsMixin:
@@ -33,7 +68,32 @@ class NoPermissionRedirectMixin:
         return redirect(reverse(self.no_permission_url, kwargs=passed_kwargs))
 
 
-class SubListMixin:
+class KeysetPaginationMixin:
+    keyset_pagination = None
+
+    def use_keyset_pagination(self):
+        if self.keyset_pagination is None:
+            return settings.BLOG_KEYSET_PAGINATION
+        return self.keyset_pagination
+
+    def get_page_obj(self, queryset, per_page):
+        if self.use_keyset_pagination():
+            return KeysetPaginator(queryset, per_page).get_page(
+                after=self.request.GET.get('after'),
+                before=self.request.GET.get('before'),
+            )
+        return Paginator(queryset, per_page).get_page(
+            self.request.GET.get('page')
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.use_keyset_pagination():
+            return super().paginate_queryset(queryset, page_size)
+        page = self.get_page_obj(queryset, page_size)
+        return page.paginator, page, page.object_list, page.has_other_pages()
+
+
+class SubListMixin(KeysetPaginationMixin):
     paginate_sublist_by = None
 
     def get_sublist_queryset(self):
@@ -43,8 +103,42 @@ class SubListMixin:
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['page_obj'] = Paginator(
-            self.get_sublist_queryset(),
-            self.paginate_sublist_by,
-        ).get_page(self.request.GET.get('page'))
+        context['page_obj'] = self.get_page_obj(
+            self.get_sublist_queryset(), self.paginate_sublist_by
+        )
         return context
+
+
+class PostCardsMixin:
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        attach_card_versions(context['page_obj'])
+        return context
+
+
+class AnonymousPageCacheMixin:
+    def dispatch(self, request, *args, **kwargs):
+        if not is_cacheable(request):
+            return super().dispatch(request, *args, **kwargs)
+        key = anonymous_page_key(request)
+        response = cache.get(key)
+        if response is None:
+            # The page is cached under the current version stamp, so it
+            # is built from `default`, never from a lagging replica.
+            allow_replica_reads(False)
+            response = cache_anonymous_page(
+                key, super().dispatch(request, *args, **kwargs)
+            )
+        return response
+
+
+class ReplicaReadMixin:
+    """Serve the view from the read replica unless the user just wrote.
+
+    Querysets evaluated by the template read from the replica too:
+    `PrimaryPinMiddleware` keeps the choice until the response is rendered.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        allow_replica_reads(not getattr(request, 'pinned_to_primary', False))
+        return super().dispatch(request, *args, **kwargs)
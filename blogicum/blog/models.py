@@ -1,7 +1,12 @@
 from django.contrib.auth import get_user_model
-from django.db import models
-
-from blog.managers import CategoryManager, CommentManager, PostManager
+from django.db import models, transaction
+
+from blog.managers import (
+    CategoryManager,
+    CommentManager,
+    ImageJobManager,
+    PostManager,
+)
 from core.constants import FIELDS_MAX_LENGTH, STR_LENGTH
 
 User = get_user_model()
@@ -83,6 +88,19 @@ class Post(PublishedAndCreatedAt):
         verbose_name="Категория",
     )
     image = models.ImageField('Изображение', blank=True)
+    comment_count = models.PositiveIntegerField(
+        'Количество комментариев',
+        default=0,
+        editable=False,
+        help_text='Считается автоматически по опубликованным комментариям.',
+    )
+    image_ready = models.BooleanField(
+        'Изображение обработано',
+        default=True,
+        editable=False,
+        help_text='Пока загруженное изображение обрабатывается, '
+        'вместо него показывается заглушка.',
+    )
 
     objects = PostManager()
 
@@ -91,10 +109,34 @@ class Post(PublishedAndCreatedAt):
         verbose_name = "публикация"
         verbose_name_plural = "Публикации"
         ordering = ("-pub_date",)
+        indexes = (
+            models.Index(
+                fields=("pub_date", "id"),
+                condition=models.Q(is_published=True),
+                name="post_public_feed_idx",
+            ),
+            models.Index(
+                fields=("category", "pub_date", "id"),
+                condition=models.Q(is_published=True),
+                name="post_category_feed_idx",
+            ),
+            models.Index(
+                fields=("author", "pub_date", "id"),
+                name="post_author_feed_idx",
+            ),
+        )
 
     def __str__(self) -> str:
         return self.title[:STR_LENGTH]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if 'image' in instance.__dict__:
+            # Lets blog.signals queue processing only for a new upload.
+            instance._stored_image = instance.image.name
+        return instance
+
 
 class Comment(PublishedAndCreatedAt):
     author = models.ForeignKey(
@@ -111,8 +153,85 @@ class Comment(PublishedAndCreatedAt):
         default_related_name = 'comments'
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
+        indexes = (
+            models.Index(
+                fields=('post', 'created_at'), name='comment_post_thread_idx'
+            ),
+        )
 
     def __str__(self):
         return (
             f'{self.post}: [@{self.author.username}] {self.text[:STR_LENGTH]}'
         )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if {'is_published', 'post_id'} <= instance.__dict__.keys():
+            # Lets blog.signals adjust Post.comment_count on save without
+            # re-reading the comment's previous state.
+            instance._counted_post_id = (
+                instance.post_id if instance.is_published else None
+            )
+        return instance
+
+    def save(self, *args, **kwargs):
+        # Keeps the comment row and Post.comment_count (updated by the
+        # signal handlers in blog.signals) in one transaction.
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+
+
+class BatchJobCheckpoint(models.Model):
+    name = models.CharField(
+        'Задача', max_length=FIELDS_MAX_LENGTH, unique=True
+    )
+    last_pk = models.BigIntegerField('Последний обработанный id', default=0)
+    processed = models.BigIntegerField('Обработано строк', default=0)
+    started_at = models.DateTimeField('Начата', auto_now_add=True)
+    updated_at = models.DateTimeField('Обновлена', auto_now=True)
+    finished_at = models.DateTimeField('Завершена', null=True, blank=True)
+
+    class Meta:
+        verbose_name = 'контрольная точка пакетной задачи'
+        verbose_name_plural = 'Контрольные точки пакетных задач'
+
+    def __str__(self):
+        return f'{self.name}: id > {self.last_pk}'
+
+
+class ImageJob(models.Model):
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'В очереди'
+        RUNNING = 'running', 'Обрабатывается'
+        DONE = 'done', 'Готово'
+        FAILED = 'failed', 'Ошибка'
+
+    post = models.ForeignKey(
+        Post, on_delete=models.CASCADE, verbose_name='Публикация'
+    )
+    image = models.CharField('Файл', max_length=FIELDS_MAX_LENGTH)
+    status = models.CharField(
+        'Состояние',
+        max_length=16,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField('Попыток', default=0)
+    error = models.TextField('Последняя ошибка', blank=True)
+    created_at = models.DateTimeField('Добавлена', auto_now_add=True)
+    started_at = models.DateTimeField('Начата', null=True, blank=True)
+    finished_at = models.DateTimeField('Завершена', null=True, blank=True)
+
+    objects = ImageJobManager()
+
+    class Meta:
+        default_related_name = 'image_jobs'
+        verbose_name = 'обработка изображения'
+        verbose_name_plural = 'Очередь обработки изображений'
+        indexes = (
+            models.Index(fields=('status', 'id'), name='image_job_queue_idx'),
+        )
+
+    def __str__(self):
+        return f'{self.image}: {self.get_status_display()}'
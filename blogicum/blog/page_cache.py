@@ -0,0 +1,52 @@
+"""Full-response cache of feed pages for anonymous readers.
+
+Logged-out readers get the same HTML for a given URL (the header shows the
+login links and no CSRF token), so the rendered response is cached under
+the full path and a global version stamp. Signal handlers in blog.signals
+bump the stamp whenever anything shown in a feed changes, and entries
+expire no later than the next delayed post goes public. Pages cached by
+another worker go stale along with the stamp only when all workers share
+one cache backend; with a per-process LocMemCache they live out their
+timeout.
+"""
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+
+from blog.clock import seconds_until_next_publication
+from core.constants import ANONYMOUS_PAGE_CACHE_TIMEOUT
+
+VERSION_KEY = 'blog:page_version'
+PAGE_KEY = 'blog:page:{version}:{path}'
+
+
+def forget_anonymous_pages():
+    cache.set(VERSION_KEY, time.time_ns(), None)
+
+
+def anonymous_page_key(request):
+    path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+    return PAGE_KEY.format(version=cache.get(VERSION_KEY, 0), path=path)
+
+
+def is_cacheable(request):
+    return request.method in ('GET', 'HEAD') and (
+        not request.user.is_authenticated
+    )
+
+
+def cache_anonymous_page(key, response):
+    patch_vary_headers(response, ('Cookie',))
+    if response.status_code != 200 or response.cookies:
+        return response
+    timeout = seconds_until_next_publication(ANONYMOUS_PAGE_CACHE_TIMEOUT)
+    if hasattr(response, 'render') and callable(response.render):
+        response.add_post_render_callback(
+            lambda rendered: cache.set(key, rendered, timeout)
+        )
+    else:
+        cache.set(key, response, timeout)
+    return response
@@ -1,38 +1,118 @@
 from django.db import models
-from django.utils.timezone import now
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from blog.clock import publication_now
+
+
+def _pk_of(user_or_pk):
+    return getattr(user_or_pk, 'pk', user_or_pk)
 
 
 class PostQuerySet(models.QuerySet):
-    def of_author(self, user):
-        return self.filter(author__username=user.username)
+    def of_author(self, user_or_pk):
+        return self.filter(author_id=_pk_of(user_or_pk))
 
     def _public_q(self):
         return models.Q(
             is_published=True,
-            pub_date__lt=now(),
+            pub_date__lt=publication_now(),
             category__is_published=True,
         )
 
     def public(self):
         return self.filter(self._public_q())
 
-    def visible_for(self, user):
-        return self.filter(
-            models.Q(author__username=user.username) | self._public_q()
-        )
+    def visible_for(self, user_or_pk):
+        author_id = _pk_of(user_or_pk)
+        if author_id is None:
+            return self.public()
+        return self.filter(models.Q(author_id=author_id) | self._public_q())
 
     def from_old_to_new(self):
         return self.order_by('-pub_date')
 
     def with_comment_counts(self):
-        return self.annotate(comment_count=models.Count('comments'))
+        # `comment_count` is a stored column maintained by blog.signals.
+        return self.all()
+
+    def recount_comments(self):
+        comments = self.model._meta.get_field('comments').related_model
+        actual = Coalesce(
+            models.Subquery(
+                comments.objects.filter(
+                    post=models.OuterRef('pk'), is_published=True
+                )
+                .order_by()
+                .values('post')
+                .annotate(total=models.Count('pk'))
+                .values('total')
+            ),
+            0,
+        )
+        return (
+            self.annotate(actual_comment_count=actual)
+            .exclude(comment_count=models.F('actual_comment_count'))
+            .update(comment_count=actual)
+        )
 
 
 class CommentQuerySet(models.QuerySet):
+    THREAD_FIELDS = (
+        'is_published',
+        'created_at',
+        'post_id',
+        'text',
+        'author__username',
+    )
+
     def of_post(self, post):
-        return self.filter(post__pk=post.pk)
+        return self.filter(post_id=_pk_of(post))
+
+    def for_thread(self):
+        # Only what includes/comments.html shows: the parent post is
+        # already on the page, so it is neither joined nor loaded. Hidden
+        # comments are left out, as they are from `Post.comment_count`.
+        return (
+            self.filter(is_published=True)
+            .select_related('author')
+            .only(*self.THREAD_FIELDS)
+        )
+
+    def with_relations(self):
+        return self.select_related('author', 'post')
 
 
 class CategoryQuerySet(models.QuerySet):
     def public(self):
         return self.filter(is_published=True)
+
+
+class ImageJobQuerySet(models.QuerySet):
+    def claimable(self, stale_after):
+        # A job left running longer than `stale_after` belongs to a worker
+        # that died mid-way and is handed out again.
+        return self.filter(
+            models.Q(status='pending')
+            | models.Q(
+                status='running',
+                started_at__lt=timezone.now() - stale_after,
+            )
+        )
+
+    def claim(self, stale_after):
+        """Atomically take the oldest claimable job, or return None.
+
+        The conditional UPDATE lets several workers poll the same table
+        without a broker: only one of them changes the row.
+        """
+        candidates = self.claimable(stale_after).order_by('pk')
+        for pk in candidates.values_list('pk', flat=True)[:10]:
+            claimed = candidates.filter(pk=pk).update(
+                status='running',
+                started_at=timezone.now(),
+                attempts=models.F('attempts') + 1,
+            )
+            if claimed:
+                return self.select_related('post').get(pk=pk)
+        return None
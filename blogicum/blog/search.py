@@ -0,0 +1,136 @@
+"""Full-text search over posts.
+
+On SQLite the index is the FTS5 table `blog_post_search`, whose rowid is
+the post id and whose columns hold stemmed words of the post title, text
+and category title. Words are stemmed in Python with the Snowball Russian
+stemmer, so "путешествия" finds "путешествие". Signal handlers in
+blog.signals keep the index current; `manage.py rebuild_search_index`
+rebuilds it in batches after bulk changes that bypass signals. Other
+databases fall back to unranked `icontains` matching.
+"""
+
+import re
+
+from django.db import connection, models
+from django.db.models.expressions import RawSQL
+
+try:
+    import snowballstemmer
+except ImportError:  # pragma: no cover
+    snowballstemmer = None
+
+SEARCH_TABLE = 'blog_post_search'
+# bm25() weights of the title, text and category columns.
+RANK_WEIGHTS = (10.0, 1.0, 5.0)
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+_stemmer = snowballstemmer and snowballstemmer.stemmer('russian')
+
+
+def is_supported(using=connection):
+    return using.vendor == 'sqlite'
+
+
+def stem_words(text):
+    words = _WORD_RE.findall((text or '').lower().replace('ё', 'е'))
+    return _stemmer.stemWords(words) if _stemmer else words
+
+
+def stem_text(text):
+    return ' '.join(stem_words(text))
+
+
+def match_expression(query):
+    # Each stem is quoted so user input cannot inject FTS5 syntax, and
+    # made a prefix query so "гор" also matches "горный".
+    return ' '.join(f'"{stem}"*' for stem in stem_words(query))
+
+
+def index_rows(rows, using=connection):
+    """Index `(post_id, title, text, category_title)` tuples."""
+    if not is_supported(using):
+        return
+    rows = [
+        (pk, stem_text(title), stem_text(text), stem_text(category))
+        for pk, title, text, category in rows
+    ]
+    with using.cursor() as cursor:
+        cursor.executemany(
+            f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s',
+            [(row[0],) for row in rows],
+        )
+        cursor.executemany(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, title, text, category) '
+            'VALUES (%s, %s, %s, %s)',
+            rows,
+        )
+
+
+def index_post(post):
+    index_rows(
+        [
+            (
+                post.pk,
+                post.title,
+                post.text,
+                post.category.title if post.category_id else '',
+            )
+        ]
+    )
+
+
+def unindex_post(pk):
+    if is_supported():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [pk]
+            )
+
+
+def set_category_title(category_pk, title):
+    if is_supported():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {SEARCH_TABLE} SET category = %s WHERE rowid IN '
+                '(SELECT id FROM blog_post WHERE category_id = %s)',
+                [stem_text(title), category_pk],
+            )
+
+
+def clear_index(using=connection):
+    if is_supported(using):
+        with using.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+
+
+def search_posts(queryset, query):
+    """Filter `queryset` by `query`, best matches first."""
+    expression = match_expression(query)
+    if not expression:
+        return queryset.none()
+    if not is_supported():
+        return queryset.filter(
+            models.Q(title__icontains=query)
+            | models.Q(text__icontains=query)
+            | models.Q(category__title__icontains=query)
+        ).order_by('-pub_date')
+    weights = ', '.join(str(weight) for weight in RANK_WEIGHTS)
+    table = queryset.model._meta.db_table
+    return (
+        queryset.filter(
+            pk__in=RawSQL(
+                f'SELECT rowid FROM {SEARCH_TABLE} '
+                f'WHERE {SEARCH_TABLE} MATCH %s',
+                (expression,),
+            )
+        )
+        .annotate(
+            search_rank=RawSQL(
+                f'SELECT bm25({SEARCH_TABLE}, {weights}) FROM {SEARCH_TABLE}'
+                f' WHERE {SEARCH_TABLE} MATCH %s'
+                f' AND rowid = "{table}"."id"',
+                (expression,),
+            )
+        )
+        .order_by('search_rank', '-pub_date')
+    )
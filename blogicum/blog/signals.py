@@ -0,0 +1,180 @@
+from django.db import models, transaction
+from django.db.models.functions import Greatest
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from blog import image_jobs, search, thumbnails
+from blog.cards import bump_card_version
+from blog.clock import forget_scheduled_pub_date
+from blog.lookups import forget_lookups
+from blog.models import Category, Comment, Location, Post, User
+from blog.page_cache import forget_anonymous_pages
+
+
+def _shift_comment_count(post_id, delta):
+    # Clamped: the stored count may lag behind bulk changes.
+    Post.objects.filter(pk=post_id).update(
+        comment_count=Greatest(models.F('comment_count') + delta, 0)
+    )
+    bump_card_version('post', post_id)
+    forget_anonymous_pages()
+
+
+@receiver(pre_save, sender=Comment)
+def remember_counted_post(sender, instance, raw=False, **kwargs):
+    if raw or instance._state.adding:
+        instance._counted_post_id = None
+    elif not hasattr(instance, '_counted_post_id'):
+        instance._counted_post_id = (
+            Comment.objects.filter(pk=instance.pk, is_published=True)
+            .values_list('post_id', flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Comment)
+def update_count_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    before = getattr(instance, '_counted_post_id', None)
+    after = instance.post_id if instance.is_published else None
+    instance._counted_post_id = after
+    if before == after:
+        return
+    if before is not None:
+        _shift_comment_count(before, -1)
+    if after is not None:
+        _shift_comment_count(after, 1)
+
+
+def _deletes_posts(origin):
+    if isinstance(origin, models.QuerySet):
+        return origin.model is Post
+    return isinstance(origin, Post)
+
+
+@receiver(post_delete, sender=Comment)
+def update_count_on_delete(sender, instance, origin=None, **kwargs):
+    # Comments deleted along with their post leave no count to update.
+    if instance.is_published and not _deletes_posts(origin):
+        _shift_comment_count(instance.post_id, -1)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def reschedule_publication_clock(sender, **kwargs):
+    forget_scheduled_pub_date()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post_card(sender, instance, **kwargs):
+    bump_card_version('post', instance.pk)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_cards(sender, instance, **kwargs):
+    bump_card_version('category', instance.pk)
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_location_cards(sender, instance, **kwargs):
+    bump_card_version('location', instance.pk)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_lookups(sender, **kwargs):
+    forget_lookups(sender)
+
+
+@receiver(post_save, sender=User)
+def invalidate_author_cards(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or 'username' in update_fields:
+        bump_card_version('user', instance.pk)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_anonymous_pages(sender, **kwargs):
+    forget_anonymous_pages()
+
+
+@receiver(post_save, sender=User)
+def invalidate_anonymous_pages_on_rename(sender, update_fields=None, **kwargs):
+    if update_fields is None or 'username' in update_fields:
+        forget_anonymous_pages()
+
+
+@receiver(post_save, sender=Post)
+def index_post_for_search(sender, instance, **kwargs):
+    search.index_post(instance)
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post_for_search(sender, instance, **kwargs):
+    search.unindex_post(instance.pk)
+
+
+@receiver(post_save, sender=Category)
+def reindex_category_for_search(sender, instance, **kwargs):
+    search.set_category_title(instance.pk, instance.title)
+
+
+@receiver(pre_delete, sender=Category)
+def unindex_category_for_search(sender, instance, **kwargs):
+    search.set_category_title(instance.pk, '')
+
+
+@receiver(pre_save, sender=Post)
+def hide_unprocessed_image(sender, instance, raw=False, **kwargs):
+    if raw or 'image' not in instance.__dict__:
+        return
+    instance._image_changed = instance.image.name != getattr(
+        instance, '_stored_image', None
+    )
+    if instance._image_changed:
+        instance.image_ready = not instance.image
+
+
+@receiver(post_save, sender=Post)
+def queue_image_processing(sender, instance, raw=False, **kwargs):
+    if not getattr(instance, '_image_changed', False):
+        return
+    instance._image_changed = False
+    _release_image(
+        instance.image.storage, getattr(instance, '_stored_image', None)
+    )
+    instance._stored_image = instance.image.name
+    if instance.image:
+        image_jobs.enqueue(instance)
+
+
+def _release_image(storage, name):
+    # Content-addressed files may be shared by several posts: a file goes
+    # only when no post refers to it any more.
+    def delete_if_unused():
+        if not Post.objects.filter(image=name).exists():
+            thumbnails.delete_image(name, storage)
+
+    if name:
+        transaction.on_commit(delete_if_unused)
+
+
+@receiver(post_delete, sender=Post)
+def release_deleted_image(sender, instance, **kwargs):
+    if 'image' in instance.__dict__ and instance.image:
+        _release_image(instance.image.storage, instance.image.name)
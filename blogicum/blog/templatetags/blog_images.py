@@ -0,0 +1,13 @@
+from django import template
+
+from blog.thumbnails import SIZES, image_sources
+
+register = template.Library()
+
+
+@register.inclusion_tag('includes/post_image.html')
+def post_image(post, variant):
+    context = {'post': post, 'sizes': SIZES}
+    if post.image_ready:
+        context.update(image_sources(post.image, variant))
+    return context
@@ -0,0 +1,163 @@
+"""Resized variants of `Post.image`.
+
+Each variant is a separate file stored next to the original under a name
+derived from it (`posts/cat.jpg` -> `posts/thumbs/cat_640w.webp`), so the
+model needs no extra fields and a re-uploaded image gets fresh variants.
+`VARIANTS` lists the widths offered through `srcset` wherever an image is
+shown, up to the 2x (retina) rendition of the 40rem card. Every width is
+written in the original format and in each format of `MODERN_FORMATS`
+that this Pillow build can encode.
+
+The work happens outside of requests, in the worker of blog.image_jobs.
+"""
+
+import posixpath
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import ExifTags, Image, ImageOps, features
+
+from core.constants import THUMBNAIL_QUALITY
+
+VARIANTS = {
+    'card': (320, 640, 1280),
+    'detail': (640, 1280, 1920),
+}
+# Cards and the detail page are 40rem wide, or the whole narrow screen.
+SIZES = '(max-width: 40rem) 100vw, 40rem'
+WIDTHS = sorted({width for widths in VARIANTS.values() for width in widths})
+THUMBS_DIR = 'thumbs'
+# Best first: browsers take the first <source> whose type they support.
+MODERN_FORMATS = tuple(
+    (ext, mime)
+    for ext, mime, feature in (
+        ('.avif', 'image/avif', 'avif'),
+        ('.webp', 'image/webp', 'webp'),
+    )
+    if feature in features.modules and features.check_module(feature)
+)
+
+
+def thumbnail_name(name, width, ext=None):
+    directory, filename = posixpath.split(name)
+    stem, original_ext = posixpath.splitext(filename)
+    return posixpath.join(
+        directory, THUMBS_DIR, f'{stem}_{width}w{ext or original_ext}'
+    )
+
+
+def has_thumbnails(name, storage=default_storage):
+    return storage.exists(thumbnail_name(name, WIDTHS[-1]))
+
+
+def _encode(image, ext, quality=THUMBNAIL_QUALITY):
+    image_format = Image.registered_extensions().get(ext.lower(), 'JPEG')
+    if image_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+    buffer = BytesIO()
+    # Pillow writes no EXIF unless it is passed in explicitly.
+    image.save(buffer, format=image_format, quality=quality)
+    return buffer.getvalue()
+
+
+def _replace(storage, name, content):
+    content = ContentFile(content)
+    if hasattr(storage, 'save_as'):
+        # Content-addressed storage would otherwise rename the file.
+        storage.save_as(name, content)
+        return
+    if storage.exists(name):
+        storage.delete(name)
+    storage.save(name, content)
+
+
+def strip_metadata(name, storage=default_storage):
+    """Rewrite the original without EXIF (camera, GPS), keeping its look.
+
+    Returns whether the file had metadata and was rewritten.
+    """
+    with storage.open(name) as source:
+        image = Image.open(source)
+        image.load()
+    exif = image.getexif()
+    if not exif and 'exif' not in image.info:
+        return False
+    quality = 95
+    if exif.get(ExifTags.Base.Orientation, 1) != 1:
+        image = ImageOps.exif_transpose(image)
+    elif image.format == 'JPEG':
+        # Reuse the original quantization tables: no visible recompression.
+        quality = 'keep'
+    _replace(
+        storage, name, _encode(image, posixpath.splitext(name)[1], quality)
+    )
+    return True
+
+
+def generate_thumbnails(name, storage=default_storage):
+    """Write every width of `name`; returns how many files were written.
+
+    Images are never upscaled: a width larger than the original gets a
+    copy at the original size, so every name in `srcset` exists.
+    The widest variant in the original format is written last and marks
+    the set as complete.
+    """
+    with storage.open(name) as source:
+        original = ImageOps.exif_transpose(Image.open(source))
+        original.load()
+    extensions = [ext for ext, _ in MODERN_FORMATS]
+    extensions.append(posixpath.splitext(name)[1])
+    for ext in extensions:
+        for width in WIDTHS:
+            image = original.copy()
+            image.thumbnail((width, width * 10))
+            _replace(
+                storage,
+                thumbnail_name(name, width, ext),
+                _encode(image, ext),
+            )
+    return len(WIDTHS) * len(extensions)
+
+
+def ensure_thumbnails(name, storage=default_storage):
+    if name and not has_thumbnails(name, storage):
+        return generate_thumbnails(name, storage)
+    return 0
+
+
+def delete_image(name, storage=default_storage):
+    """Delete an original together with all of its variants."""
+    extensions = [ext for ext, _ in MODERN_FORMATS] + [None]
+    for ext in extensions:
+        for width in WIDTHS:
+            storage.delete(thumbnail_name(name, width, ext))
+    storage.delete(name)
+
+
+def _srcset(image, variant, ext=None):
+    return ', '.join(
+        f'{image.storage.url(thumbnail_name(image.name, width, ext))} {width}w'
+        for width in VARIANTS[variant]
+    )
+
+
+def image_sources(image, variant):
+    """`src`, `srcset` and modern-format `<source>`s of an image field.
+
+    Falls back to the original alone while the variants are missing.
+    """
+    if not image:
+        return {'src': '', 'srcset': '', 'sources': ()}
+    if not has_thumbnails(image.name, image.storage):
+        return {'src': image.url, 'srcset': '', 'sources': ()}
+    return {
+        'src': image.storage.url(
+            thumbnail_name(image.name, VARIANTS[variant][1])
+        ),
+        'srcset': _srcset(image, variant),
+        'sources': tuple(
+            (mime, _srcset(image, variant, ext))
+            for ext, mime in MODERN_FORMATS
+        ),
+    }
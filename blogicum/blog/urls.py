@@ -6,12 +6,14 @@ from blog.views import (
     CommentDeleteView,
     CommentUpdateView,
     IndexPage,
+    PostCommentsView,
     PostCreateView,
     PostDeleteView,
     PostDetailView,
     PostUpdateView,
     ProfileDetailView,
     ProfileUpdateView,
+    SearchView,
 )
 
 app_name = 'blog'
@@ -39,6 +41,11 @@ urlpatterns = [
         CommentCreateView.as_view(),
         name='add_comment',
     ),
+    path(
+        'posts/<int:post_id>/comments/',
+        PostCommentsView.as_view(),
+        name='post_comments',
+    ),
     path(
         'posts/<int:post_id>/edit_comment/<int:comment_id>/',
         CommentUpdateView.as_view(),
@@ -54,5 +61,6 @@ urlpatterns = [
         CategoryDetailView.as_view(),
         name='category_posts',
     ),
+    path('search/', SearchView.as_view(), name='search'),
     path('', IndexPage.as_view(), name='index'),
 ]
@@ -1,5 +1,7 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.utils.http import urlencode
 from django.views.generic import (
     CreateView,
     DeleteView,
@@ -8,21 +10,36 @@ from django.views.generic import (
     UpdateView,
 )
 
+from blog import lookups, search
 from blog.forms import CommentForm, PostForm
 from blog.mixins import (
+    AnonymousPageCacheMixin,
+    KeysetPaginationMixin,
     NoPermissionRedirectMixin,
+    PostCardsMixin,
+    ReplicaReadMixin,
     SubListMixin,
     SuccessUrlArgsMixin,
     UserIsAuthorMixin,
 )
-from blog.models import Category, Comment, Post, User
-from core.constants import POSTS_PER_PAGE
+from blog.models import Comment, Post, User
+from blog.paginators import CommentKeysetPaginator
+from core.constants import COMMENTS_PER_PAGE, POSTS_PER_PAGE
 
 
-class IndexPage(ListView):
+class IndexPage(
+    ReplicaReadMixin,
+    AnonymousPageCacheMixin,
+    PostCardsMixin,
+    KeysetPaginationMixin,
+    ListView,
+):
     template_name = 'blog/index.html'
     paginate_by = POSTS_PER_PAGE
-    queryset = Post.objects.public().with_comment_counts().from_old_to_new()
+
+    def get_queryset(self):
+        # Built per request: public() captures the publication clock.
+        return Post.objects.public().with_comment_counts().from_old_to_new()
 
 
 class ProfileView:
@@ -33,7 +50,9 @@ class ProfileView:
     context_object_name = 'profile'
 
 
-class ProfileDetailView(ProfileView, SubListMixin, DetailView):
+class ProfileDetailView(
+    ReplicaReadMixin, ProfileView, PostCardsMixin, SubListMixin, DetailView
+):
     paginate_sublist_by = POSTS_PER_PAGE
 
     def get_sublist_queryset(self):
@@ -80,7 +99,7 @@ class PostCreateView(
         return [self.request.user.username]
 
 
-class PostDetailView(PostView, DetailView):
+class PostDetailView(ReplicaReadMixin, PostView, DetailView):
     template_name = 'blog/detail.html'
 
     def get_queryset(self):
@@ -91,7 +110,36 @@ class PostDetailView(PostView, DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = Comment.objects.of_post(self.object)
+        context['comments'] = CommentKeysetPaginator(
+            Comment.objects.of_post(self.object).for_thread(),
+            COMMENTS_PER_PAGE,
+        ).get_page()
+        return context
+
+
+class PostCommentsView(ListView):
+    template_name = 'includes/comments.html'
+    context_object_name = 'comments'
+    paginate_by = COMMENTS_PER_PAGE
+
+    def get_queryset(self):
+        self.commented_post = get_object_or_404(
+            Post.objects.filter(pk=self.kwargs['post_id']).visible_for(
+                self.request.user
+            )
+        )
+        return Comment.objects.of_post(self.commented_post).for_thread()
+
+    def paginate_queryset(self, queryset, page_size):
+        page = CommentKeysetPaginator(queryset, page_size).get_page(
+            after=self.request.GET.get('after')
+        )
+        return page.paginator, page, page, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['post'] = self.commented_post
+        context['comments_fragment'] = True
         return context
 
 
@@ -160,7 +208,7 @@ class CommentUpdateView(
     form_class = CommentForm
 
     def get_success_url_args(self):
-        return [self.object.post.pk]
+        return [self.object.post_id]
 
 
 class CommentDeleteView(
@@ -172,17 +220,48 @@ class CommentDeleteView(
     DeleteView,
 ):
     def get_success_url_args(self):
-        return [self.object.post.pk]
+        return [self.object.post_id]
 
 
-class CategoryDetailView(SubListMixin, DetailView):
+class CategoryDetailView(
+    ReplicaReadMixin,
+    AnonymousPageCacheMixin,
+    PostCardsMixin,
+    SubListMixin,
+    DetailView,
+):
     template_name = 'blog/category.html'
     slug_url_kwarg = 'category_slug'
-    queryset = Category.objects.public()
     context_object_name = 'category'
     paginate_sublist_by = POSTS_PER_PAGE
 
+    def get_object(self, queryset=None):
+        category = lookups.public_category(self.kwargs[self.slug_url_kwarg])
+        if category is None:
+            raise Http404('Категория не найдена.')
+        return category
+
     def get_sublist_queryset(self):
         return (
             self.object.posts.public().with_comment_counts().from_old_to_new()
         )
+
+
+class SearchView(PostCardsMixin, ListView):
+    template_name = 'blog/search.html'
+    paginate_by = POSTS_PER_PAGE
+
+    def get_search_query(self):
+        return self.request.GET.get('q', '').strip()
+
+    def get_queryset(self):
+        return search.search_posts(
+            Post.objects.public().with_comment_counts(),
+            self.get_search_query(),
+        )
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['query'] = self.get_search_query()
+        context['pagination_prefix'] = f"{urlencode({'q': context['query']})}&"
+        return context
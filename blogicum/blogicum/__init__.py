@@ -0,0 +1,17 @@
+import os
+
+SETTINGS_MODULES = {
+    'development': 'blogicum.settings',
+    'production': 'blogicum.settings_production',
+}
+
+
+def settings_module():
+    """Settings module for the BLOGICUM_ENV environment variable."""
+    env = os.environ.get('BLOGICUM_ENV', 'development')
+    if env not in SETTINGS_MODULES:
+        raise RuntimeError(
+            f'Unknown BLOGICUM_ENV {env!r}; expected one of '
+            f'{", ".join(SETTINGS_MODULES)}.'
+        )
+    return SETTINGS_MODULES[env]
@@ -27,6 +27,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.RequestMetricsMiddleware',
+    'core.middleware.PrimaryPinMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -47,6 +49,15 @@ TEMPLATES_DIR = BASE_DIR / 'templates'
 
 MEDIA_ROOT = BASE_DIR / 'media'
 
+STORAGES = {
+    'default': {
+        'BACKEND': 'core.storage.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -78,6 +89,12 @@ DATABASES = {
     }
 }
 
+DATABASE_ROUTERS = ['core.routers.PrimaryReplicaRouter']
+
+# Псевдоним реплики для чтения лент и страниц публикаций; пока такой базы
+# нет в DATABASES, всё читается из default.
+REPLICA_DATABASE = 'replica'
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -109,5 +126,24 @@ STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+BLOG_KEYSET_PAGINATION = False
+
+# Публичные ленты округляют «сейчас» до стольких секунд; 0 — без округления.
+BLOG_PUBLICATION_CLOCK_BUCKET = 30
+
+# Сколько запросов к БД допустимо на один запрос к странице; превышения
+# пишутся в лог и считаются на /internal/metrics/. None — без ограничения.
+QUERY_BUDGET_DEFAULT = 10
+QUERY_BUDGETS = {
+    'admin:blog_post_changelist': 20,
+    'admin:blog_post_change': 20,
+    'admin:auth_user_changelist': 20,
+}
+
+# Адреса, с которых /internal/metrics/ доступна без входа (персонал видит
+# её всегда). Не INTERNAL_IPS: за прокси на том же хосте 127.0.0.1 — это
+# любой посетитель.
+METRICS_ALLOWED_IPS = ['127.0.0.1']
+
 EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
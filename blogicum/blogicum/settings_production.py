@@ -0,0 +1,92 @@
+"""Production settings; selected with BLOGICUM_ENV=production.
+
+Everything not overridden here comes from blogicum.settings.
+"""
+
+import os
+
+from blogicum.settings import *  # noqa: F401, F403
+from blogicum.settings import (
+    BASE_DIR,
+    DATABASES,
+    INSTALLED_APPS,
+    MIDDLEWARE,
+)
+
+DEBUG = False
+
+SECRET_KEY = os.environ['DJANGO_SECRET_KEY']
+
+ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', 'localhost').split(',')
+
+# Behind a proxy every request comes from its address: metrics stay
+# staff-only unless the scraper's addresses are listed explicitly.
+METRICS_ALLOWED_IPS = [
+    ip
+    for ip in os.environ.get('DJANGO_METRICS_ALLOWED_IPS', '').split(',')
+    if ip
+]
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app != 'debug_toolbar']
+
+MIDDLEWARE = [
+    middleware
+    for middleware in MIDDLEWARE
+    if not middleware.startswith('debug_toolbar.')
+]
+
+DATABASES = {
+    alias: {
+        **database,
+        # Persistent connections: requests skip the connect and the PRAGMAs.
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            **database.get('OPTIONS', {}),
+            # Take the write lock at BEGIN, so a writer waits for
+            # busy_timeout instead of failing on a lock upgrade.
+            'transaction_mode': 'IMMEDIATE',
+        },
+    }
+    for alias, database in DATABASES.items()
+}
+
+if os.environ.get('DJANGO_REPLICA_DB_PATH'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': os.environ['DJANGO_REPLICA_DB_PATH'],
+    }
+
+# Version stamps of the blog caches (lookups, cards, anonymous pages) are
+# bumped in the process that saw the change: every worker must read the
+# same cache, so the in-process default is never used here. Redis when
+# configured, a directory on the shared disk otherwise.
+if os.environ.get('DJANGO_REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['DJANGO_REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get(
+                'DJANGO_CACHE_DIR', str(BASE_DIR / 'cache')
+            ),
+            # Cards and pages add up to far more than the default 300.
+            'OPTIONS': {'MAX_ENTRIES': 100_000},
+        }
+    }
+
+# Applied by core.db to every new SQLite connection. WAL lets readers
+# run next to the writer; NORMAL sync is durable with WAL except on power
+# loss; the map covers the hot part of the database file.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'mmap_size': 256 * 1024 * 1024,
+    'busy_timeout': 5000,
+    'temp_store': 'MEMORY',
+}
@@ -5,6 +5,8 @@ from django.contrib.auth.forms import UserCreationForm
 from django.urls import include, path, reverse_lazy
 from django.views.generic.edit import CreateView
 
+from core.views import metrics, serve_media
+
 handler404 = 'pages.views.not_found_page'
 handler500 = 'pages.views.internal_error_page'
 
@@ -21,6 +23,7 @@ urlpatterns = [
         name='registration',
     ),
     path('pages/', include('pages.urls', namespace='pages')),
+    path('internal/metrics/', metrics, name='metrics'),
     path('', include('blog.urls', namespace='blog')),
 ]
 
@@ -30,5 +33,7 @@ if settings.DEBUG:
     urlpatterns.append(path('__debug__/', include(debug_toolbar.urls)))
 
     urlpatterns += static(
-        settings.MEDIA_URL, document_root=settings.MEDIA_ROOT
+        settings.MEDIA_URL,
+        view=serve_media,
+        document_root=settings.MEDIA_ROOT,
     )
@@ -1,3 +1,15 @@
 FIELDS_MAX_LENGTH = 256
 STR_LENGTH = 20
 POSTS_PER_PAGE = 10
+POST_CARD_CACHE_TIMEOUT = 60 * 60
+ANONYMOUS_PAGE_CACHE_TIMEOUT = 5 * 60
+COMMENTS_PER_PAGE = 20
+ESTIMATED_COUNT_THRESHOLD = 100_000
+ADMIN_TEXT_PREVIEW_LENGTH = 50
+THUMBNAIL_QUALITY = 85
+IMAGE_JOB_MAX_ATTEMPTS = 3
+IMAGE_JOB_TIMEOUT = 10 * 60
+IMAGE_JOB_POLL_INTERVAL = 2
+MEDIA_CACHE_MAX_AGE = 365 * 24 * 60 * 60
+PRIMARY_PIN_SECONDS = 10
+LOOKUP_CACHE_TIMEOUT = 24 * 60 * 60
@@ -0,0 +1,119 @@
+"""In-process request metrics, aggregated per resolved view name.
+
+`core.middleware.RequestMetricsMiddleware` feeds `registry`; the
+`metrics` URL (`/internal/metrics/`, served by `core.views.metrics`)
+renders it in the Prometheus text format. Every
+worker process keeps its own registry, so a scraper sees per-process
+series, the same as with the Prometheus multiprocess-less client.
+"""
+
+import bisect
+import threading
+from collections import defaultdict
+
+INF = float('inf')
+
+# Upper bounds of the histogram buckets of every metric.
+METRICS = {
+    'queries': (
+        'SQL queries per request',
+        (1, 2, 3, 5, 8, 13, 21, 34, 55, 89, INF),
+    ),
+    'sql_seconds': (
+        'Total SQL time per request, seconds',
+        (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, INF),
+    ),
+    'render_seconds': (
+        'Template render time per request, seconds',
+        (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, INF),
+    ),
+    'response_bytes': (
+        'Response body size, bytes',
+        (1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, INF),
+    ),
+}
+
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.total = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self):
+        running = 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            yield bound, running
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = defaultdict(dict)
+        self.budget_overruns = defaultdict(int)
+
+    def observe(self, view_name, **values):
+        with self._lock:
+            histograms = self._histograms[view_name]
+            for metric, value in values.items():
+                if value is None:
+                    continue
+                if metric not in histograms:
+                    histograms[metric] = Histogram(METRICS[metric][1])
+                histograms[metric].observe(value)
+
+    def overrun(self, view_name):
+        with self._lock:
+            self.budget_overruns[view_name] += 1
+
+    def snapshot(self, view_name, metric):
+        with self._lock:
+            return self._histograms.get(view_name, {}).get(metric)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.budget_overruns.clear()
+
+    def render(self, prefix='blogicum'):
+        """Prometheus text exposition of all histograms."""
+        lines = []
+        with self._lock:
+            for metric, (description, _) in METRICS.items():
+                name = f'{prefix}_request_{metric}'
+                lines += [
+                    f'# HELP {name} {description}',
+                    f'# TYPE {name} histogram',
+                ]
+                for view_name, histograms in sorted(self._histograms.items()):
+                    histogram = histograms.get(metric)
+                    if histogram is None:
+                        continue
+                    label = f'view="{view_name}"'
+                    for bound, count in histogram.cumulative():
+                        le = '+Inf' if bound == INF else f'{bound:g}'
+                        lines.append(
+                            f'{name}_bucket{{{label},le="{le}"}} {count}'
+                        )
+                    lines += [
+                        f'{name}_sum{{{label}}} {histogram.total:g}',
+                        f'{name}_count{{{label}}} {histogram.count}',
+                    ]
+            name = f'{prefix}_query_budget_overruns_total'
+            lines += [
+                f'# HELP {name} Requests over the query budget of their view',
+                f'# TYPE {name} counter',
+            ]
+            for view_name, count in sorted(self.budget_overruns.items()):
+                lines.append(f'{name}{{view="{view_name}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
@@ -0,0 +1,121 @@
+import logging
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from core.constants import PRIMARY_PIN_SECONDS
+from core.metrics import registry
+from core.routers import replica_scope
+
+logger = logging.getLogger(__name__)
+
+UNRESOLVED = '<unresolved>'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS', 'TRACE')
+PIN_COOKIE = 'pin_primary'
+
+
+class QueryStats:
+    """`execute_wrapper` callback that counts queries and their time."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+
+class RequestMetricsMiddleware:
+    """Record queries, SQL time, render time and size of every response.
+
+    Cheap enough for production: no SQL is kept, only counters. Should be
+    the first middleware, so that the session and user lookups count too.
+    A request spending more queries than the budget of its view (see
+    `QUERY_BUDGETS`) is logged as a warning.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        stats = QueryStats()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(stats))
+            request._render_seconds = None
+            response = self.get_response(request)
+        self.record(request, response, stats)
+        return response
+
+    def process_template_response(self, request, response):
+        # Runs right before rendering; the callback right after it.
+        started = time.perf_counter()
+
+        def rendered(response):
+            request._render_seconds = time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+        return response
+
+    def record(self, request, response, stats):
+        match = getattr(request, 'resolver_match', None)
+        view_name = (match and match.view_name) or UNRESOLVED
+        size = None if response.streaming else len(response.content)
+        registry.observe(
+            view_name,
+            queries=stats.count,
+            sql_seconds=stats.seconds,
+            render_seconds=request._render_seconds,
+            response_bytes=size,
+        )
+        budget = settings.QUERY_BUDGETS.get(
+            view_name, settings.QUERY_BUDGET_DEFAULT
+        )
+        if budget is not None and stats.count > budget:
+            registry.overrun(view_name)
+            logger.warning(
+                'Query budget exceeded: %s %s ran %d queries (budget %d,'
+                ' %.1f ms SQL)',
+                request.method,
+                request.get_full_path(),
+                stats.count,
+                budget,
+                stats.seconds * 1000,
+                extra={'view_name': view_name},
+            )
+
+
+class PrimaryPinMiddleware:
+    """Pin a user to the primary database for a while after a write.
+
+    A successful unsafe request (a form POST of PostCreateView,
+    CommentCreateView and the like) sets a short-lived cookie; while it
+    lives `request.pinned_to_primary` is true and the views that read
+    from the replica read from `default` instead. The replica scope of
+    `core.routers` is opened here so that it also covers rendering.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        wrote = request.method not in SAFE_METHODS
+        request.pinned_to_primary = wrote or PIN_COOKIE in request.COOKIES
+        with replica_scope():
+            response = self.get_response(request)
+        if wrote and response.status_code < 400:
+            response.set_cookie(
+                PIN_COOKIE,
+                '1',
+                max_age=PRIMARY_PIN_SECONDS,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
@@ -0,0 +1,67 @@
+"""Send the reads of selected views to a read replica.
+
+`core.middleware.PrimaryPinMiddleware` opens a `replica_scope()` around
+each request, view and template rendering alike. Inside it, a view may
+call `allow_replica_reads()`, as `blog.mixins.ReplicaReadMixin` does for
+the public feed and detail views. From then on, reads of blog content go
+to `settings.REPLICA_DATABASE`, if that alias is configured. Sessions and
+users are always read from `default`, so a lagging replica cannot log
+anyone out. Everything else, and every write, uses `default`.
+
+The middleware keeps a user on `default` for a few seconds after they
+wrote something, so they see their own changes before the replica
+catches up. Caches whose keys are bumped by signals must not be filled
+from the replica: a lagging row would be stored under the new version.
+Check `reading_replica()` before filling one.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_APPS = {'blog'}
+
+_scope = ContextVar('replica_scope', default=None)
+
+
+@contextmanager
+def replica_scope():
+    scope = {'enabled': False}
+    token = _scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _scope.reset(token)
+
+
+def allow_replica_reads(enabled=True):
+    # Outside of a scope (no middleware) reads stay on `default`.
+    scope = _scope.get()
+    if scope is not None:
+        scope['enabled'] = enabled
+
+
+def replica_alias():
+    alias = getattr(settings, 'REPLICA_DATABASE', None)
+    return alias if alias in connections.settings else None
+
+
+def reading_replica():
+    scope = _scope.get()
+    return bool(scope and scope['enabled'] and replica_alias())
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label in REPLICA_APPS and reading_replica():
+            return replica_alias()
+        return None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data.
+        return True
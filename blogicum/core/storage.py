@@ -0,0 +1,53 @@
+"""Media storage that names files after their contents.
+
+An upload is stored as `<upload_to>/<aa>/<sha256><ext>`, where `aa` are the
+first two hex digits of the hash, so identical uploads share one file and
+a URL never points at different bytes. The name is the hash of the bytes
+as uploaded: background processing may rewrite the file once (EXIF
+stripping) before the post reveals it, and a re-upload of the same bytes
+still finds it.
+
+Files derived from a stored name (thumbnails) are written under their own
+names with `save_as`. Deleting is left to the callers, which know how many
+rows still refer to a file.
+"""
+
+import hashlib
+import posixpath
+
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+from core.constants import MEDIA_CACHE_MAX_AGE
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    cache_max_age = MEDIA_CACHE_MAX_AGE
+
+    def content_name(self, name, content):
+        digest = hashlib.sha256()
+        if hasattr(content, 'seek'):
+            content.seek(0)
+        for chunk in content.chunks():
+            digest.update(chunk)
+        if hasattr(content, 'seek'):
+            content.seek(0)
+        digest = digest.hexdigest()
+        directory = posixpath.dirname(name.replace('\\', '/'))
+        ext = posixpath.splitext(name)[1].lower()
+        return posixpath.join(directory, digest[:2], f'{digest}{ext}')
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        name = self.content_name(name, content)
+        if self.exists(name):
+            return name
+        return super().save(name, content, max_length)
+
+    def save_as(self, name, content):
+        """Write `content` under exactly `name`, replacing what is there."""
+        if self.exists(name):
+            self.delete(name)
+        return super().save(name, content)
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import Http404, HttpResponse
+from django.views.static import serve
+
+from core.metrics import registry
+
+
+def serve_media(request, path, document_root=None, show_indexes=False):
+    """`django.views.static.serve` that lets browsers keep media forever.
+
+    Used when Django itself serves MEDIA_ROOT; a front web server should
+    send the same header for MEDIA_URL.
+    """
+    response = serve(request, path, document_root, show_indexes)
+    max_age = getattr(default_storage, 'cache_max_age', None)
+    if max_age and response.status_code == 200:
+        response['Cache-Control'] = f'public, max-age={max_age}, immutable'
+    return response
+
+
+def metrics(request):
+    """Request metrics for scrapers on METRICS_ALLOWED_IPS and for staff."""
+    allowed = request.META.get('REMOTE_ADDR') in settings.METRICS_ALLOWED_IPS
+    if not (allowed or request.user.is_staff):
+        raise Http404
+    return HttpResponse(
+        registry.render(), content_type='text/plain; version=0.0.4'
+    )
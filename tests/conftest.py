@@ -92,6 +92,8 @@ pytest_plugins = [
     "fixtures.locations",
     "fixtures.categories",
     "fixtures.comments",
+    "fixtures.databases",
+    "fixtures.images",
     "adapters.comment",
 ]
 
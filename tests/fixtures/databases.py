@@ -0,0 +1,21 @@
+import pytest
+
+TEST_REPLICA = "test_replica"
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(
+        django_db_modify_db_settings_parallel_suffix, tmp_path_factory
+):
+    """Add a replica alias backed by its own SQLite file.
+
+    Routing to it stays off unless a test sets `REPLICA_DATABASE`.
+    """
+    from django.conf import settings
+
+    replica = dict(settings.DATABASES["default"])
+    replica["TEST"] = {
+        **replica.get("TEST", {}),
+        "NAME": str(tmp_path_factory.mktemp("replica") / "replica.sqlite3"),
+    }
+    settings.DATABASES[TEST_REPLICA] = replica
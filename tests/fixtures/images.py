@@ -0,0 +1,25 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from django.core.cache import cache
+from django.core.files.images import ImageFile
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    cache.clear()
+    yield tmp_path
+    cache.clear()
+
+
+def image_file(
+        name="photo.jpg", size=(1600, 900), color=(73, 109, 137), exif=None
+):
+    buffer = BytesIO()
+    Image.new("RGB", size, color=color).save(
+        buffer, format="JPEG", exif=exif or Image.Exif()
+    )
+    buffer.seek(0)
+    return ImageFile(buffer, name=name)
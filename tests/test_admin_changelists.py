@@ -0,0 +1,99 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _changelist_queries(admin_client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = admin_client.get(url)
+    assert response.status_code == 200
+    return response, len(queries)
+
+
+def _users_with_posts(mixer, published_category, n_users):
+    users = mixer.cycle(n_users).blend("auth.User")
+    for user in users:
+        mixer.cycle(2).blend(
+            "blog.Post", author=user, category=published_category
+        )
+    return users
+
+
+def test_user_changelist_query_count_is_constant(
+        admin_client, mixer, published_category
+):
+    _users_with_posts(mixer, published_category, 2)
+    _, few = _changelist_queries(admin_client, "/admin/auth/user/")
+    _users_with_posts(mixer, published_category, 20)
+    _, many = _changelist_queries(admin_client, "/admin/auth/user/")
+    assert few == many, (
+        "Убедитесь, что число запросов списка пользователей в админке не"
+        " зависит от числа пользователей."
+    )
+
+
+def test_user_changelist_sorts_by_post_count(
+        admin_client, mixer, published_category, user
+):
+    mixer.cycle(5).blend("blog.Post", author=user, category=published_category)
+    _users_with_posts(mixer, published_category, 3)
+    response, _ = _changelist_queries(admin_client, "/admin/auth/user/?o=-6")
+    users = list(response.context["cl"].result_list)
+    assert users[0] == user and users[0].posts_total == 5
+    assert [u.posts_total for u in users] == sorted(
+        (u.posts_total for u in users), reverse=True
+    )
+
+
+def test_post_changelist_query_count_is_constant(
+        admin_client, mixer, user, published_category, published_locations
+):
+    mixer.cycle(2).blend("blog.Post", author=user, category=published_category)
+    _, few = _changelist_queries(admin_client, "/admin/blog/post/")
+    mixer.cycle(20).blend(
+        "blog.Post", author=user, category=published_category
+    )
+    response, many = _changelist_queries(admin_client, "/admin/blog/post/")
+    assert few == many, (
+        "Убедитесь, что выпадающие списки категорий и местоположений в"
+        " списке публикаций не запрашиваются для каждой строки."
+    )
+
+
+def test_post_changelist_shows_text_preview_from_sql(
+        admin_client, mixer, user, published_category
+):
+    from core.constants import ADMIN_TEXT_PREVIEW_LENGTH
+
+    long_text = "ж" * (ADMIN_TEXT_PREVIEW_LENGTH * 3)
+    mixer.blend(
+        "blog.Post", author=user, category=published_category, text=long_text
+    )
+    with CaptureQueriesContext(connection) as queries:
+        response = admin_client.get("/admin/blog/post/")
+    content = response.content.decode()
+    assert "ж" * ADMIN_TEXT_PREVIEW_LENGTH + "…" in content
+    assert long_text not in content
+    assert all(long_text not in q["sql"] for q in queries)
+
+
+def test_estimated_count_paginator(mixer, user, published_category):
+    from blog.models import Post
+    from blog.paginators import EstimatedCountPaginator
+
+    mixer.cycle(5).blend("blog.Post", author=user, category=published_category)
+    last_id = Post.objects.order_by("-id").values_list("id", flat=True)[0]
+    Post.objects.order_by("id")[0].delete()
+
+    class SmallThresholdPaginator(EstimatedCountPaginator):
+        threshold = 1
+
+    with CaptureQueriesContext(connection) as queries:
+        estimated = SmallThresholdPaginator(Post.objects.all(), 10).count
+    assert estimated == last_id
+    assert not any("COUNT(" in q["sql"] for q in queries)
+    filtered = Post.objects.filter(author=user)
+    assert SmallThresholdPaginator(filtered, 10).count == 4
+    assert EstimatedCountPaginator(Post.objects.all(), 10).count == 4
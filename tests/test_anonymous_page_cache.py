@@ -0,0 +1,74 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _get(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200
+    return response.content.decode(), len(queries)
+
+
+@pytest.mark.parametrize("url_kind", ["index", "category"])
+def test_anonymous_feed_served_from_cache(
+        client, post_with_published_location, url_kind
+):
+    url = "/"
+    if url_kind == "category":
+        url = f"/category/{post_with_published_location.category.slug}/"
+    first, _ = _get(client, url)
+    second, n_queries = _get(client, url)
+    assert second == first
+    assert n_queries == 0, (
+        "Убедитесь, что повторный запрос ленты анонимным пользователем"
+        " отдаётся из кеша без обращения к БД."
+    )
+
+
+def test_anonymous_cache_keys_on_query_string(
+        client, many_posts_with_published_locations
+):
+    first_page, _ = _get(client, "/")
+    second_page, _ = _get(client, "/?page=2")
+    assert first_page != second_page
+
+
+def test_anonymous_cache_invalidated_by_changes(
+        client, mixer, user, post_with_published_location
+):
+    post = post_with_published_location
+    _get(client, "/")
+    mixer.blend("blog.Comment", post=post)
+    content, _ = _get(client, "/")
+    assert "Комментарии (1)" in content, (
+        "Убедитесь, что новый комментарий сбрасывает кеш страницы ленты."
+    )
+    post.category.is_published = False
+    post.category.save()
+    content, _ = _get(client, "/")
+    assert post.title not in content, (
+        "Убедитесь, что снятие категории с публикации сбрасывает кеш"
+        " страницы ленты."
+    )
+
+
+def test_logged_in_users_bypass_cache(
+        client, user_client, user, post_with_published_location
+):
+    _get(client, "/")
+    content, n_queries = _get(user_client, "/")
+    assert user.username in content and n_queries > 0, (
+        "Убедитесь, что авторизованным пользователям не отдаётся"
+        " закешированная анонимная страница."
+    )
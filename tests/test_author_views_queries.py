@@ -0,0 +1,89 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+# Every author-only request loads the session, the user and the edited
+# object exactly once; the rest is the work of the endpoint itself.
+AUTHOR_QUERIES = {
+    ("get", "edit_post"): 5,  # + locations and categories, on a cold cache
+    ("post", "edit_post"): 8,  # + categories (cold), UPDATE, search index
+    ("get", "delete_post"): 3,
+    ("post", "delete_post"): 8,  # + cascades, DELETE, search index
+    ("get", "edit_comment"): 3,
+    ("post", "edit_comment"): 6,  # + UPDATE in a savepoint
+    ("get", "delete_comment"): 3,
+    ("post", "delete_comment"): 5,  # + DELETE, comment counter
+}
+NOT_AUTHOR_QUERIES = 3
+
+
+@pytest.fixture
+def own_comment(mixer, user, post_with_published_location):
+    return mixer.blend(
+        "blog.Comment", post=post_with_published_location, author=user
+    )
+
+
+def _url(endpoint, post, comment):
+    if endpoint.endswith("_comment"):
+        action = endpoint.split("_")[0]
+        return f"/posts/{post.id}/{action}_comment/{comment.id}/"
+    return f"/posts/{post.id}/{endpoint.split('_')[0]}/"
+
+
+def _form_data(endpoint, post):
+    if endpoint == "edit_post":
+        return {
+            "title": "Новый заголовок",
+            "text": "Новый текст",
+            "pub_date": "2020-01-01T00:00",
+            "category": post.category_id,
+        }
+    if endpoint == "edit_comment":
+        return {"text": "Новый текст"}
+    return {}
+
+
+def _count_queries(client, method, url, data):
+    cache.clear()
+    with CaptureQueriesContext(connection) as queries:
+        response = getattr(client, method)(url, data)
+    return response, len(queries)
+
+
+@pytest.mark.parametrize(("method", "endpoint"), list(AUTHOR_QUERIES))
+def test_author_endpoint_query_count(
+        user_client, post_with_published_location, own_comment, method,
+        endpoint
+):
+    post = post_with_published_location
+    response, n_queries = _count_queries(
+        user_client, method, _url(endpoint, post, own_comment),
+        _form_data(endpoint, post),
+    )
+    assert response.status_code in (HTTPStatus.OK, HTTPStatus.FOUND)
+    expected = AUTHOR_QUERIES[(method, endpoint)]
+    assert n_queries == expected, (
+        f"Убедитесь, что `{method.upper()} {endpoint}` выполняет"
+        f" {expected} запросов к БД, а не {n_queries}: объект должен"
+        " загружаться один раз вместе с проверкой авторства."
+    )
+
+
+@pytest.mark.parametrize(("method", "endpoint"), list(AUTHOR_QUERIES))
+def test_not_author_endpoint_query_count(
+        another_user_client, post_with_published_location, own_comment,
+        method, endpoint
+):
+    post = post_with_published_location
+    response, n_queries = _count_queries(
+        another_user_client, method, _url(endpoint, post, own_comment),
+        _form_data(endpoint, post),
+    )
+    assert response.status_code == HTTPStatus.FOUND
+    assert n_queries == NOT_AUTHOR_QUERIES
@@ -0,0 +1,83 @@
+import pytest
+from django.core.management import call_command
+
+from blog import search
+
+pytestmark = [pytest.mark.django_db]
+
+
+class Crash(Exception):
+    pass
+
+
+@pytest.fixture
+def posts(mixer, user, published_category):
+    return mixer.cycle(5).blend(
+        "blog.Post", author=user, category=published_category
+    )
+
+
+def _checkpoint():
+    from blog.models import BatchJobCheckpoint
+
+    return BatchJobCheckpoint.objects.get(name="rebuild_search_index")
+
+
+def test_batch_job_resumes_after_crash(monkeypatch, posts):
+    indexed = []
+    index_rows = search.index_rows
+
+    def failing_index_rows(rows, *args, **kwargs):
+        rows = list(rows)
+        if len(indexed) >= 2:
+            raise Crash
+        indexed.extend(pk for pk, *_ in rows)
+        index_rows(rows, *args, **kwargs)
+
+    monkeypatch.setattr(search, "index_rows", failing_index_rows)
+    with pytest.raises(Crash):
+        call_command("rebuild_search_index", batch_size=2, verbosity=0)
+    checkpoint = _checkpoint()
+    assert checkpoint.last_pk == posts[1].pk and checkpoint.processed == 2, (
+        "Убедитесь, что контрольная точка сохраняется после каждой пачки."
+    )
+    assert checkpoint.finished_at is None
+
+    indexed.clear()
+    monkeypatch.setattr(search, "index_rows", index_rows)
+    resumed = []
+
+    def recording_index_rows(rows, *args, **kwargs):
+        rows = list(rows)
+        resumed.extend(pk for pk, *_ in rows)
+        index_rows(rows, *args, **kwargs)
+
+    monkeypatch.setattr(search, "index_rows", recording_index_rows)
+    call_command("rebuild_search_index", batch_size=2, verbosity=0)
+    assert resumed == [post.pk for post in posts[2:]], (
+        "Убедитесь, что прерванная пакетная команда продолжает работу с"
+        " места остановки."
+    )
+    checkpoint = _checkpoint()
+    assert checkpoint.processed == 5 and checkpoint.finished_at is not None
+
+
+def test_finished_batch_job_starts_over(posts):
+    call_command("rebuild_search_index", verbosity=0)
+    call_command("rebuild_search_index", verbosity=0)
+    assert _checkpoint().processed == len(posts)
+
+
+def test_batch_job_throttles(monkeypatch, posts):
+    from blog.management import batch
+
+    slept = []
+    monkeypatch.setattr(batch.time, "sleep", slept.append)
+    monkeypatch.setattr(batch.time, "monotonic", lambda: 0.0)
+    call_command(
+        "rebuild_search_index", batch_size=1, rows_per_second=10, verbosity=0
+    )
+    expected = [rows / 10 for rows in range(1, len(posts) + 1)]
+    assert slept == pytest.approx(expected), (
+        "Убедитесь, что `--rows-per-second` ограничивает скорость обработки."
+    )
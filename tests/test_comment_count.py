@@ -0,0 +1,98 @@
+import pytest
+from django.core.management import call_command
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _stored_count(post):
+    post.refresh_from_db(fields=["comment_count"])
+    return post.comment_count
+
+
+def test_comment_count_follows_comment_changes(
+        mixer, post_with_published_location
+):
+    post = post_with_published_location
+    comments = mixer.cycle(3).blend("blog.Comment", post=post)
+    assert _stored_count(post) == 3, (
+        "Убедитесь, что при создании комментария увеличивается"
+        " `Post.comment_count`."
+    )
+
+    comments[0].is_published = False
+    comments[0].save()
+    assert _stored_count(post) == 2, (
+        "Убедитесь, что снятый с публикации комментарий не учитывается в"
+        " `Post.comment_count`."
+    )
+
+    comments[1].delete()
+    comments[0].delete()
+    assert _stored_count(post) == 1, (
+        "Убедитесь, что при удалении комментария уменьшается"
+        " `Post.comment_count`."
+    )
+
+
+def test_comment_moved_between_posts(mixer, user, published_category):
+    first, second = mixer.cycle(2).blend(
+        "blog.Post", author=user, category=published_category
+    )
+    comment = mixer.blend("blog.Comment", post=first)
+    comment.post = second
+    comment.save()
+    assert (_stored_count(first), _stored_count(second)) == (0, 1)
+
+
+def test_recount_comments_command_repairs_counts(
+        mixer, post_with_published_location
+):
+    from blog.models import Post
+
+    post = post_with_published_location
+    mixer.cycle(2).blend("blog.Comment", post=post)
+    Post.objects.filter(pk=post.pk).update(comment_count=42)
+
+    call_command("recount_comments", "--dry-run")
+    assert _stored_count(post) == 42
+
+    call_command("recount_comments")
+    assert _stored_count(post) == 2, (
+        "Убедитесь, что команда `recount_comments` исправляет"
+        " `Post.comment_count`."
+    )
+
+
+def test_deleting_post_with_drifted_count(
+        mixer, user, post_with_published_location
+):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from blog.models import Comment, Post
+
+    post = post_with_published_location
+    # bulk_create sends no signals, so the stored count stays at zero.
+    Comment.objects.bulk_create(
+        Comment(post=post, author=user, text="Комментарий")
+        for _ in range(200)
+    )
+    with CaptureQueriesContext(connection) as queries:
+        post.delete()
+    assert not Post.objects.filter(pk=post.pk).exists()
+    assert len(queries) < 20, (
+        "Убедитесь, что при удалении публикации `Post.comment_count` не"
+        " пересчитывается для каждого удаляемого комментария."
+    )
+
+
+def test_comment_count_never_goes_negative(
+        mixer, post_with_published_location
+):
+    from blog.models import Post
+
+    post = post_with_published_location
+    comment = mixer.blend("blog.Comment", post=post)
+    Post.objects.filter(pk=post.pk).update(comment_count=0)
+    comment.delete()
+    assert _stored_count(post) == 0
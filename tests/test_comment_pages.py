@@ -0,0 +1,93 @@
+import re
+
+import pytest
+
+from core.constants import COMMENTS_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+MORE_LINK = re.compile(r'href="(/posts/\d+/comments/\?after=[^"]+)"')
+
+
+@pytest.fixture
+def long_thread(mixer, post_with_published_location):
+    return mixer.cycle(COMMENTS_PER_PAGE + 5).blend(
+        "blog.Comment", post=post_with_published_location
+    )
+
+
+def _comment_ids(content):
+    return [int(pk) for pk in re.findall(r'name="comment_(\d+)"', content)]
+
+
+def test_detail_page_shows_first_comment_page(
+        client, post_with_published_location, long_thread
+):
+    content = client.get(
+        f"/posts/{post_with_published_location.id}/"
+    ).content.decode()
+    assert _comment_ids(content) == [c.id for c in long_thread][
+        :COMMENTS_PER_PAGE
+    ], (
+        "Убедитесь, что на странице поста выводится только первая страница"
+        " комментариев, от старых к новым."
+    )
+    assert MORE_LINK.search(content)
+
+
+def test_comments_fragment_returns_next_page(
+        client, post_with_published_location, long_thread
+):
+    detail = client.get(f"/posts/{post_with_published_location.id}/")
+    more_url = MORE_LINK.search(detail.content.decode()).group(1)
+    response = client.get(more_url.replace("&amp;", "&"))
+    assert response.status_code == 200
+    content = response.content.decode()
+    assert _comment_ids(content) == [c.id for c in long_thread][
+        COMMENTS_PER_PAGE:
+    ], "Убедитесь, что фрагмент комментариев возвращает следующую страницу."
+    assert not MORE_LINK.search(content)
+    assert "<form" not in content and "<html" not in content
+
+
+def test_comments_fragment_hidden_for_invisible_post(
+        client, mixer, user, published_category
+):
+    post = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        is_published=False,
+    )
+    assert client.get(f"/posts/{post.id}/comments/").status_code == 404
+
+
+def test_thread_query_does_not_load_parent_post(post_with_published_location):
+    from blog.models import Comment
+
+    sql = str(
+        Comment.objects.of_post(post_with_published_location)
+        .for_thread()
+        .query
+    )
+    assert '"blog_post"' not in sql and '"text"' in sql, (
+        "Убедитесь, что при выводе комментариев к посту не загружается"
+        " сама публикация."
+    )
+
+
+def test_thread_hides_unpublished_comments(
+        client, mixer, post_with_published_location
+):
+    post = post_with_published_location
+    shown = mixer.blend("blog.Comment", post=post, text="Видимый")
+    mixer.blend("blog.Comment", post=post, text="Скрытый", is_published=False)
+    for url in (f"/posts/{post.id}/", f"/posts/{post.id}/comments/"):
+        content = client.get(url).content.decode()
+        assert shown.text in content and "Скрытый" not in content, (
+            "Убедитесь, что снятые с публикации комментарии не выводятся"
+            " на странице публикации."
+        )
+    post.refresh_from_db(fields=["comment_count"])
+    assert post.comment_count == 1, (
+        "Убедитесь, что число комментариев на карточке совпадает с числом"
+        " комментариев на странице публикации."
+    )
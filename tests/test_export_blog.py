@@ -0,0 +1,66 @@
+import json
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _export(*args, **options):
+    out = StringIO()
+    call_command("export_blog", *args, stdout=out, **options)
+    return out.getvalue()
+
+
+@pytest.fixture
+def blog_content(mixer, user, published_category, published_location):
+    posts = mixer.cycle(3).blend(
+        "blog.Post", author=user, category=published_category,
+        location=published_location,
+    )
+    mixer.cycle(2).blend("blog.Comment", author=user, post=posts[0])
+    return posts
+
+
+def test_export_formats(blog_content):
+    objects = json.loads(_export(chunk_size=2))
+    models = [obj["model"] for obj in objects]
+    assert models == (
+        ["blog.category", "blog.location"]
+        + ["blog.post"] * 3
+        + ["blog.comment"] * 2
+    ), "Убедитесь, что `export_blog` выгружает все модели блога по порядку."
+    lines = _export(format="ndjson", chunk_size=2).splitlines()
+    assert [json.loads(line) for line in lines] == objects, (
+        "Убедитесь, что `export_blog --format ndjson` выгружает объект"
+        " на строку."
+    )
+
+
+def test_export_since(blog_content):
+    from blog.models import Post
+
+    later = timezone.now() + timedelta(days=1)
+    Post.objects.filter(pk=blog_content[-1].pk).update(created_at=later)
+    objects = json.loads(_export(since=later - timedelta(hours=1)))
+    assert [(obj["model"], obj["pk"]) for obj in objects] == [
+        ("blog.post", blog_content[-1].pk)
+    ], "Убедитесь, что `--since` отбирает объекты по `created_at`."
+
+
+def test_export_import_round_trip(tmp_path, blog_content):
+    from blog.models import Comment, Post
+
+    path = tmp_path / "dump.json"
+    call_command("export_blog", output=str(path), verbosity=0)
+    before = json.loads(path.read_text(encoding="utf-8"))
+    Comment.objects.all().delete()
+    Post.objects.all().delete()
+    call_command("import_blog", str(path), verbosity=0)
+    assert json.loads(_export()) == before, (
+        "Убедитесь, что выгрузка `export_blog` загружается `import_blog`"
+        " без потерь."
+    )
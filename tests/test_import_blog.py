@@ -0,0 +1,111 @@
+import json
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+
+from fixtures.databases import TEST_REPLICA
+
+pytestmark = [pytest.mark.django_db]
+
+DB_JSON = Path(__file__).resolve().parent.parent / "db.json"
+
+
+def _fixture_objects():
+    user = {
+        "model": "auth.user", "pk": 50,
+        "fields": {"username": "importer", "password": "!",
+                   "date_joined": "2023-01-01T00:00:00Z"},
+    }
+    category = {
+        "model": "blog.category", "pk": 60,
+        "fields": {"title": "Импорт", "slug": "import",
+                   "description": "-", "is_published": True,
+                   "created_at": "2023-01-01T00:00:00Z"},
+    }
+    post = {
+        "model": "blog.post", "pk": 70,
+        "fields": {"title": "Перенесённая заметка", "text": "Текст",
+                   "pub_date": "2023-01-02T00:00:00Z", "author": 50,
+                   "category": 60, "is_published": True,
+                   "created_at": "2023-01-02T00:00:00Z"},
+    }
+    comments = [
+        {
+            "model": "blog.comment", "pk": 80 + i,
+            "fields": {"text": "Комментарий", "author": 50, "post": 70,
+                       "is_published": True,
+                       "created_at": "2023-01-03T00:00:00Z"},
+        }
+        for i in range(3)
+    ]
+    # Children before their parents, as in the project's own db.json.
+    return [*comments, post, category, user]
+
+
+@pytest.mark.parametrize("fmt", ["json", "ndjson"])
+def test_import_rebuilds_derived_data(client, tmp_path, fmt):
+    from blog.models import Post
+
+    objects = _fixture_objects()
+    path = tmp_path / f"dump.{fmt}"
+    if fmt == "json":
+        path.write_text(json.dumps(objects), encoding="utf-8")
+    else:
+        path.write_text(
+            "\n".join(json.dumps(obj) for obj in objects), encoding="utf-8"
+        )
+    call_command("import_blog", str(path), batch_size=2, verbosity=0)
+
+    post = Post.objects.get(pk=70)
+    assert post.comment_count == 3, (
+        "Убедитесь, что `import_blog` пересчитывает `Post.comment_count`."
+    )
+    assert post.created_at == datetime(2023, 1, 2, tzinfo=dt_timezone.utc), (
+        "Убедитесь, что `import_blog` сохраняет значения `created_at`."
+    )
+    response = client.get("/search/", {"q": "перенесённые"})
+    assert [p.pk for p in response.context["page_obj"]] == [70], (
+        "Убедитесь, что `import_blog` перестраивает поисковый индекс."
+    )
+
+
+def test_import_project_fixture_twice():
+    from blog.models import Category, Location, Post
+
+    expected = json.loads(DB_JSON.read_text(encoding="utf-8"))
+    for _ in range(2):
+        call_command("import_blog", str(DB_JSON), verbosity=0)
+    for model in (Category, Location, Post):
+        label = model._meta.label_lower
+        assert model.objects.count() == sum(
+            obj["model"] == label for obj in expected
+        ), "Убедитесь, что `import_blog` загружает все объекты фикстуры."
+
+
+@pytest.mark.django_db(databases=["default", TEST_REPLICA])
+def test_import_into_other_database(tmp_path):
+    from django.db import connections
+
+    from blog import search
+    from blog.models import Post
+
+    path = tmp_path / "dump.json"
+    path.write_text(json.dumps(_fixture_objects()), encoding="utf-8")
+    call_command(
+        "import_blog", str(path), database=TEST_REPLICA, verbosity=0
+    )
+
+    assert not Post.objects.filter(pk=70).exists()
+    post = Post.objects.using(TEST_REPLICA).get(pk=70)
+    assert post.comment_count == 3, (
+        "Убедитесь, что `import_blog --database` пересчитывает"
+        " `Post.comment_count` в выбранной базе."
+    )
+    with connections[TEST_REPLICA].cursor() as cursor:
+        cursor.execute(f"SELECT rowid FROM {search.SEARCH_TABLE}")
+        assert cursor.fetchall() == [(70,)], (
+            "Убедитесь, что `import_blog --database` перестраивает"
+            " поисковый индекс выбранной базы."
+        )
@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+from blog.paginators import KeysetPaginator
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def keyset_posts(mixer, user, published_category):
+    same_date = timezone.now() - timedelta(days=1)
+    dates = (
+        same_date if i % 3 == 0 else same_date - timedelta(hours=i)
+        for i in range(N_PER_PAGE * 2 + 5)
+    )
+    return mixer.cycle(N_PER_PAGE * 2 + 5).blend(
+        "blog.Post", author=user, category=published_category, pub_date=dates
+    )
+
+
+def _walk(paginator):
+    pages = [paginator.get_page()]
+    while pages[-1].has_next():
+        pages.append(paginator.get_page(after=pages[-1].next_cursor))
+    return pages
+
+
+def test_keyset_pages_cover_queryset_in_order(keyset_posts):
+    from blog.models import Post
+
+    queryset = Post.objects.public()
+    pages = _walk(KeysetPaginator(queryset, N_PER_PAGE))
+    walked = [post.pk for page in pages for post in page]
+    expected = list(
+        queryset.order_by("-pub_date", "-pk").values_list("pk", flat=True)
+    )
+    assert walked == expected, (
+        "Убедитесь, что страницы курсорной пагинации по очереди выдают все"
+        " публикации в порядке `(-pub_date, -id)` без пропусков и повторов."
+    )
+    assert not pages[0].has_previous()
+    assert all(len(page) == N_PER_PAGE for page in pages[:-1])
+
+
+def test_keyset_before_cursor_returns_previous_page(keyset_posts):
+    from blog.models import Post
+
+    paginator = KeysetPaginator(Post.objects.public(), N_PER_PAGE)
+    first, second = _walk(paginator)[:2]
+    back = paginator.get_page(before=second.previous_cursor)
+    assert [p.pk for p in back] == [p.pk for p in first], (
+        "Убедитесь, что курсор `before` возвращает предыдущую страницу."
+    )
+    assert not back.has_previous()
+    assert back.next_cursor == first.next_cursor
+
+
+def test_keyset_invalid_cursor_gives_first_page(keyset_posts):
+    from blog.models import Post
+
+    paginator = KeysetPaginator(Post.objects.public(), N_PER_PAGE)
+    first = paginator.get_page()
+    assert [p.pk for p in paginator.get_page(after="garbage!")] == [
+        p.pk for p in first
+    ]
+
+
+@override_settings(BLOG_KEYSET_PAGINATION=True)
+def test_keyset_index_has_no_count_query(client, keyset_posts):
+    first = client.get("/")
+    cursor = first.context["page_obj"].next_cursor
+    assert cursor
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(f"/?after={cursor}")
+    assert response.status_code == 200
+    assert f"?before={response.context['page_obj'].previous_cursor}" in (
+        response.content.decode()
+    )
+    assert not any("COUNT(*)" in q["sql"].upper() for q in queries), (
+        "Убедитесь, что курсорная пагинация не выполняет `COUNT(*)`."
+    )
+    assert not any("OFFSET" in q["sql"].upper() for q in queries)
@@ -0,0 +1,129 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def cold_cache():
+    cache.clear()
+
+
+def _tables_read(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    return {
+        table
+        for query in queries
+        for table in ("blog_category", "blog_location")
+        if f'FROM "{table}"' in query["sql"]
+    }
+
+
+def test_warm_lookups_run_no_queries(published_category, published_location):
+    from blog import lookups
+    from blog.models import Category, Location
+
+    lookups.rows(Category)
+    lookups.rows(Location)
+    with CaptureQueriesContext(connection) as queries:
+        category = lookups.get(Category, slug=published_category.slug)
+        location = lookups.get(Location, pk=published_location.pk)
+    assert len(queries) == 0
+    assert category == published_category
+    assert location == published_location
+
+
+def test_save_and_delete_invalidate_lookups(published_category):
+    from blog import lookups
+    from blog.models import Category
+
+    assert lookups.get(Category, pk=published_category.pk).title == (
+        published_category.title
+    )
+    published_category.title = "Новое название"
+    published_category.save()
+    assert lookups.get(Category, pk=published_category.pk).title == (
+        "Новое название"
+    )
+    published_category.is_published = False
+    published_category.save()
+    assert lookups.public_category(published_category.slug) is None
+    published_category.delete()
+    assert lookups.get(Category, slug=published_category.slug) is None
+
+
+def test_other_process_change_reloads_local_tier(published_category):
+    from blog import lookups
+    from blog.models import Category
+
+    lookups.rows(Category)
+    # Another process updated the row and bumped the shared stamp.
+    Category.objects.filter(pk=published_category.pk).update(title="Другое")
+    lookups._bump("blog.category")
+    assert lookups.get(Category, pk=published_category.pk).title == "Другое"
+
+
+def test_returned_rows_are_copies(published_category):
+    from blog import lookups
+    from blog.models import Category
+
+    lookups.get(Category, pk=published_category.pk).title = "Изменено"
+    assert lookups.get(Category, pk=published_category.pk).title == (
+        published_category.title
+    )
+
+
+def test_category_page_reads_category_from_cache(
+        user_client, published_category, post_with_published_location
+):
+    url = f"/category/{published_category.slug}/"
+    assert _tables_read(user_client, url) == {"blog_category"}
+    assert _tables_read(user_client, url) == set()
+
+
+def test_unpublished_category_page_not_found(
+        client, published_category
+):
+    published_category.is_published = False
+    published_category.save()
+    response = client.get(f"/category/{published_category.slug}/")
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_post_form_choices_come_from_cache(
+        user_client, post_with_published_location
+):
+    url = f"/posts/{post_with_published_location.id}/edit/"
+    assert _tables_read(user_client, url) == {
+        "blog_category", "blog_location"
+    }
+    assert _tables_read(user_client, url) == set()
+
+
+def test_post_form_rejects_unknown_choices(
+        published_category, published_location
+):
+    from blog.forms import PostForm
+
+    data = {
+        "title": "Заголовок",
+        "text": "Текст",
+        "pub_date": "2020-01-01T00:00",
+        "category": published_category.pk,
+        "location": published_location.pk,
+    }
+    form = PostForm(data)
+    assert form.is_valid(), form.errors
+    assert form.cleaned_data["category"] == published_category
+    assert form.cleaned_data["location"] == published_location
+    form = PostForm({**data, "category": 10_000, "location": "x"})
+    assert not form.is_valid()
+    assert set(form.errors) == {"category", "location"}
+    rendered = str(PostForm()["category"])
+    assert f'value="{published_category.pk}"' in rendered
@@ -0,0 +1,89 @@
+import pytest
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import RequestFactory
+
+from blog import thumbnails
+from core.views import serve_media
+from fixtures.images import image_file
+
+pytestmark = [pytest.mark.django_db, pytest.mark.usefixtures("media_root")]
+
+
+def _image_file(name, color=(73, 109, 137)):
+    return image_file(name, size=(64, 48), color=color)
+
+
+@pytest.fixture
+def twin_posts(mixer, user, published_category):
+    return [
+        mixer.blend(
+            "blog.Post",
+            author=user,
+            category=published_category,
+            image=_image_file(name),
+        )
+        for name in ("first.jpg", "second.JPG")
+    ]
+
+
+def _media_files(root):
+    return sorted(
+        path.name for path in root.rglob("*") if path.is_file()
+    )
+
+
+def test_identical_uploads_share_a_file(twin_posts, media_root):
+    first, second = twin_posts
+    assert first.image.name == second.image.name, (
+        "Убедитесь, что одинаковые загруженные файлы хранятся один раз."
+    )
+    assert len(_media_files(media_root)) == 1
+    other = _image_file("first.jpg", color=(0, 0, 0))
+    assert default_storage.save("first.jpg", other) != first.image.name
+
+
+def test_shared_file_deleted_with_last_post(
+        twin_posts, media_root, django_capture_on_commit_callbacks
+):
+    first, second = twin_posts
+    call_command("process_image_jobs", once=True, verbosity=0)
+    name = first.image.name
+    with django_capture_on_commit_callbacks(execute=True):
+        first.delete()
+    assert default_storage.exists(name), (
+        "Убедитесь, что файл, на который ссылается другая публикация,"
+        " не удаляется."
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        second.delete()
+    assert _media_files(media_root) == [], (
+        "Убедитесь, что при удалении последней публикации с изображением"
+        " удаляются и файл, и его уменьшенные копии."
+    )
+
+
+def test_replaced_image_is_released(
+        twin_posts, media_root, django_capture_on_commit_callbacks
+):
+    first, second = twin_posts
+    old_name = first.image.name
+    for post in twin_posts:
+        post.image = _image_file("new.jpg", color=(255, 0, 0))
+        with django_capture_on_commit_callbacks(execute=True):
+            post.save()
+    assert not default_storage.exists(old_name)
+    assert default_storage.exists(first.image.name)
+    assert not default_storage.exists(
+        thumbnails.thumbnail_name(old_name, thumbnails.WIDTHS[0])
+    )
+
+
+def test_media_is_served_as_immutable(twin_posts, media_root):
+    request = RequestFactory().get("/")
+    response = serve_media(
+        request, twin_posts[0].image.name, document_root=media_root
+    )
+    assert "immutable" in response["Cache-Control"], (
+        "Убедитесь, что файлы медиа отдаются с долгим кешированием."
+    )
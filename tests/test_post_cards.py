@@ -0,0 +1,57 @@
+import pytest
+from django.core.cache import cache
+
+from blog.cards import CARD_KEY, attach_card_versions
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _cached_card(post):
+    fresh = post.__class__.objects.get(pk=post.pk)
+    attach_card_versions([fresh])
+    return cache.get(CARD_KEY.format(pk=fresh.pk, version=fresh.card_version))
+
+
+def test_feed_cards_are_cached(client, post_with_published_location):
+    assert _cached_card(post_with_published_location) is None
+    client.get("/")
+    card = _cached_card(post_with_published_location)
+    assert card and post_with_published_location.title in card, (
+        "Убедитесь, что карточка публикации кешируется при показе ленты."
+    )
+
+
+@pytest.mark.parametrize(
+    "change",
+    ["post_title", "category_title", "location_name", "author_username"],
+)
+def test_card_is_rerendered_after_related_change(
+        client, post_with_published_location, change
+):
+    post = post_with_published_location
+    client.get("/")
+    new_value = "Совсем новое значение"
+    if change == "post_title":
+        post.title = new_value
+        post.save()
+    elif change == "category_title":
+        post.category.title = new_value
+        post.category.save()
+    elif change == "location_name":
+        post.location.name = new_value
+        post.location.save()
+    else:
+        new_value = "renamed_author"
+        post.author.username = new_value
+        post.author.save()
+    assert new_value in client.get("/").content.decode(), (
+        "Убедитесь, что изменение публикации, категории, местоположения или"
+        " автора сбрасывает закешированную карточку публикации."
+    )
@@ -0,0 +1,104 @@
+import importlib
+
+import pytest
+from django.core.cache import CacheHandler
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import override_settings
+
+
+@pytest.fixture
+def production(monkeypatch):
+    monkeypatch.setenv("DJANGO_SECRET_KEY", "test-secret")
+    monkeypatch.setenv("DJANGO_ALLOWED_HOSTS", "blog.example.com")
+    # Reloaded so that every test reads its own environment.
+    return importlib.reload(
+        importlib.import_module("blogicum.settings_production")
+    )
+
+
+def test_production_settings(production):
+    assert production.DEBUG is False
+    assert "debug_toolbar" not in production.INSTALLED_APPS
+    assert not any(
+        "debug_toolbar" in middleware for middleware in production.MIDDLEWARE
+    ), "Убедитесь, что в боевых настройках нет debug_toolbar."
+    assert production.ALLOWED_HOSTS == ["blog.example.com"]
+    assert production.DATABASES["default"]["CONN_MAX_AGE"] > 0, (
+        "Убедитесь, что в боевых настройках соединения с БД переиспользуются."
+    )
+    assert production.METRICS_ALLOWED_IPS == [], (
+        "Убедитесь, что в боевых настройках метрики по умолчанию доступны"
+        " только персоналу."
+    )
+
+
+def _reload_with(monkeypatch, production, **env):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    return importlib.reload(production)
+
+
+def test_production_cache_is_shared_between_processes(
+        monkeypatch, production, tmp_path
+):
+    caches = _reload_with(
+        monkeypatch, production, DJANGO_CACHE_DIR=str(tmp_path)
+    ).CACHES
+    assert caches["default"]["BACKEND"] != (
+        "django.core.cache.backends.locmem.LocMemCache"
+    ), "Убедитесь, что в боевых настройках кеш общий для всех процессов."
+    # Two handlers stand for two worker processes.
+    writer = CacheHandler(caches)["default"]
+    reader = CacheHandler(caches)["default"]
+    writer.set("blog:page_version", 42)
+    assert reader.get("blog:page_version") == 42
+
+
+def test_production_cache_uses_redis_when_configured(
+        monkeypatch, production
+):
+    caches = _reload_with(
+        monkeypatch, production, DJANGO_REDIS_URL="redis://cache:6379/1"
+    ).CACHES
+    assert caches["default"] == {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://cache:6379/1",
+    }
+
+
+@pytest.mark.parametrize(
+    "env, module",
+    [(None, "blogicum.settings"),
+     ("production", "blogicum.settings_production")],
+)
+def test_settings_module_follows_env(monkeypatch, env, module):
+    from blogicum import settings_module
+
+    if env:
+        monkeypatch.setenv("BLOGICUM_ENV", env)
+    else:
+        monkeypatch.delenv("BLOGICUM_ENV", raising=False)
+    assert settings_module() == module
+
+
+@pytest.mark.django_db
+def test_sqlite_pragmas_applied_on_connect(production, tmp_path):
+    wrapper = DatabaseWrapper(
+        {**connection.settings_dict, "NAME": str(tmp_path / "prod.sqlite3")},
+        alias="pragma_test",
+    )
+    with override_settings(SQLITE_PRAGMAS=production.SQLITE_PRAGMAS):
+        wrapper.ensure_connection()
+    try:
+        with wrapper.cursor() as cursor:
+            cursor.execute("PRAGMA journal_mode")
+            assert cursor.fetchone()[0] == "wal", (
+                "Убедитесь, что при подключении к SQLite включается WAL."
+            )
+            cursor.execute("PRAGMA synchronous")
+            assert cursor.fetchone()[0] == 1  # NORMAL
+            cursor.execute("PRAGMA busy_timeout")
+            assert cursor.fetchone()[0] == 5000
+    finally:
+        wrapper.close()
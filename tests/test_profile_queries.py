@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+USERNAME_FILTER = '"auth_user"."username" ='
+
+
+def _bulk_posts(author, category, n):
+    from blog.models import Post
+
+    start = timezone.now() - timedelta(days=1)
+    Post.objects.bulk_create(
+        Post(
+            title=f"Пост {i}",
+            text="Текст",
+            pub_date=start - timedelta(minutes=i),
+            author=author,
+            category=category,
+        )
+        for i in range(n)
+    )
+
+
+def _profile_queries(client, username):
+    cache.clear()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(f"/profile/{username}/")
+    assert response.status_code == 200
+    return [q["sql"] for q in queries]
+
+
+@pytest.mark.parametrize("client_fixture", ["unlogged_client", "user_client"])
+def test_profile_query_count_does_not_grow_with_posts(
+        request, client_fixture, user, published_category
+):
+    client = request.getfixturevalue(client_fixture)
+    _bulk_posts(user, published_category, 10)
+    few = _profile_queries(client, user.username)
+    _bulk_posts(user, published_category, 2000)
+    many = _profile_queries(client, user.username)
+    assert len(few) == len(many), (
+        "Убедитесь, что число запросов к БД на странице пользователя не"
+        " зависит от числа его публикаций."
+    )
+
+
+def test_profile_resolves_username_once(
+        another_user_client, user, published_category
+):
+    _bulk_posts(user, published_category, 20)
+    queries = _profile_queries(another_user_client, user.username)
+    by_username = [sql for sql in queries if USERNAME_FILTER in sql]
+    assert len(by_username) <= 1, (
+        "Убедитесь, что на странице пользователя он ищется по имени один раз,"
+        " а публикации фильтруются по `author_id`."
+    )
+    post_queries = [sql for sql in queries if '"blog_post"' in sql]
+    assert post_queries
+    assert all(USERNAME_FILTER not in sql for sql in post_queries)
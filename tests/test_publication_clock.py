@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+
+from blog import clock
+
+pytestmark = [pytest.mark.django_db]
+
+BUCKET_START = datetime(2030, 1, 1, 12, 0, 0, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    cache.clear()
+    moment = {"now": BUCKET_START + timedelta(seconds=10)}
+    monkeypatch.setattr(timezone, "now", lambda: moment["now"])
+    yield moment
+    cache.clear()
+
+
+@override_settings(BLOG_PUBLICATION_CLOCK_BUCKET=30)
+def test_public_sql_repeats_within_bucket(frozen_now):
+    from blog.models import Post
+
+    first_sql = str(Post.objects.public().query)
+    frozen_now["now"] += timedelta(seconds=15)
+    assert clock.publication_now() == BUCKET_START
+    assert str(Post.objects.public().query) == first_sql, (
+        "Убедитесь, что в пределах одного интервала часов публикации"
+        " запросы к публичной ленте совпадают."
+    )
+    frozen_now["now"] += timedelta(seconds=10)
+    assert clock.publication_now() == BUCKET_START + timedelta(seconds=30)
+
+
+@override_settings(BLOG_PUBLICATION_CLOCK_BUCKET=30)
+def test_delayed_post_appears_on_time(
+        frozen_now, mixer, user, published_category
+):
+    from blog.models import Post
+
+    delayed = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        pub_date=BUCKET_START + timedelta(seconds=20),
+    )
+    assert not Post.objects.public().filter(pk=delayed.pk).exists()
+
+    frozen_now["now"] = BUCKET_START + timedelta(seconds=21)
+    assert Post.objects.public().filter(pk=delayed.pk).exists(), (
+        "Убедитесь, что отложенная публикация появляется в ленте в момент"
+        " `pub_date`, а не в начале следующего интервала."
+    )
+    assert clock.seconds_until_next_publication() is None
+
+
+@override_settings(BLOG_PUBLICATION_CLOCK_BUCKET=0)
+def test_zero_bucket_disables_rounding(frozen_now):
+    assert clock.publication_now() == frozen_now["now"]
+
+
+@override_settings(BLOG_PUBLICATION_CLOCK_BUCKET=30)
+def test_post_scheduled_at_bucket_start_is_public(
+        frozen_now, mixer, user, published_category
+):
+    from blog.models import Post
+
+    on_boundary = mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        pub_date=BUCKET_START,
+    )
+    assert Post.objects.public().filter(pk=on_boundary.pk).exists(), (
+        "Убедитесь, что публикация, запланированная ровно на начало"
+        " интервала, видна в ленте сразу после `pub_date`."
+    )
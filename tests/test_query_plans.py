@@ -0,0 +1,165 @@
+import re
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        connection.vendor != "sqlite",
+        reason="Проверяется вывод `EXPLAIN QUERY PLAN` SQLite.",
+    ),
+]
+
+FULL_SCAN = re.compile(r"\bSCAN (blog_post|blog_comment)\b(?! USING)")
+
+
+def _assert_uses_index(queryset, index_name, access_path):
+    plan = queryset.explain()
+    assert index_name in plan, (
+        f"Убедитесь, что запрос {access_path} использует индекс"
+        f" `{index_name}`. План запроса:\n{plan}"
+    )
+    assert not FULL_SCAN.search(plan), (
+        f"Запрос {access_path} полностью сканирует таблицу."
+        f" План запроса:\n{plan}"
+    )
+    assert "TEMP B-TREE" not in plan, (
+        f"Запрос {access_path} сортирует строки во временном B-дереве"
+        f" вместо чтения в порядке индекса. План запроса:\n{plan}"
+    )
+
+
+def test_index_feed_plan():
+    from blog.models import Post
+
+    _assert_uses_index(
+        Post.objects.public().with_comment_counts().from_old_to_new()[:10],
+        "post_public_feed_idx",
+        "главной страницы",
+    )
+
+
+def test_category_feed_plan(published_category):
+    _assert_uses_index(
+        published_category.posts.public()
+        .with_comment_counts()
+        .from_old_to_new()[:10],
+        "post_category_feed_idx",
+        "страницы категории",
+    )
+
+
+def test_author_feed_plan(user, another_user):
+    from blog.models import Post
+
+    _assert_uses_index(
+        Post.objects.of_author(user)
+        .visible_for(another_user)
+        .with_comment_counts()
+        .from_old_to_new()[:10],
+        "post_author_feed_idx",
+        "страницы пользователя",
+    )
+
+
+def test_comment_thread_plan(post_with_published_location):
+    from blog.models import Comment
+
+    _assert_uses_index(
+        Comment.objects.of_post(post_with_published_location),
+        "comment_post_thread_idx",
+        "комментариев к посту",
+    )
+
+
+SEEK_CURSOR = (datetime(2024, 1, 1, tzinfo=dt_timezone.utc), 5)
+
+
+def _seek_plans(paginator):
+    # `after` continues in feed order, `before` goes back against it.
+    forward, backward = (
+        ("lt", "gt") if paginator.descending else ("gt", "lt")
+    )
+    return {
+        "after": paginator._seek(SEEK_CURSOR, forward)
+        .order_by(*paginator._ordering(forward=True))[:11]
+        .explain(),
+        "before": paginator._seek(SEEK_CURSOR, backward)
+        .order_by(*paginator._ordering(forward=False))[:11]
+        .explain(),
+    }
+
+
+@pytest.mark.parametrize("feed", ["published", "thread"])
+def test_keyset_seek_is_index_range(feed):
+    from blog.models import Comment, Post
+    from blog.paginators import CommentKeysetPaginator, KeysetPaginator
+
+    if feed == "published":
+        paginator = KeysetPaginator(Post.objects.filter(is_published=True), 10)
+        index, column = "post_public_feed_idx", "pub_date"
+    else:
+        paginator = CommentKeysetPaginator(
+            Comment.objects.of_post(1).for_thread(), 10
+        )
+        index, column = "comment_post_thread_idx", "created_at"
+    for direction, plan in _seek_plans(paginator).items():
+        assert index in plan and re.search(rf"\b{column}[<>]\?", plan), (
+            f"Убедитесь, что переход по курсору ({direction}) ограничивает"
+            f" диапазон индекса `{index}` по `{column}`, а не перебирает"
+            f" все строки до курсора. План запроса:\n{plan}"
+        )
+
+
+def _vm_steps(callback):
+    steps = [0]
+
+    def count():
+        steps[0] += 1
+
+    connection.ensure_connection()
+    connection.connection.set_progress_handler(count, 100)
+    try:
+        callback()
+    finally:
+        connection.connection.set_progress_handler(None, 0)
+    return steps[0]
+
+
+def test_deep_public_feed_page_costs_as_much_as_first(
+        user, published_category
+):
+    from blog.models import Post
+    from blog.paginators import KeysetPaginator
+
+    start = timezone.now() - timedelta(days=30)
+    Post.objects.bulk_create(
+        Post(
+            title="Пост",
+            text="Текст",
+            author=user,
+            category=published_category,
+            pub_date=start + timedelta(minutes=i),
+        )
+        for i in range(3000)
+    )
+    paginator = KeysetPaginator(Post.objects.public().from_old_to_new(), 10)
+    rows = list(
+        Post.objects.order_by("-pub_date", "-pk").values_list("pub_date", "pk")
+    )
+    shallow, deep = (
+        _vm_steps(
+            lambda cursor=paginator.encode_cursor(*rows[depth]): (
+                paginator.get_page(after=cursor)
+            )
+        )
+        for depth in (10, 2900)
+    )
+    assert deep < shallow * 2, (
+        "Убедитесь, что глубокая страница ленты (курсор `after`) стоит"
+        " столько же, сколько первая, а не перебирает строки до курсора:"
+        f" {shallow} против {deep} шагов SQLite."
+    )
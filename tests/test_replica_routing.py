@@ -0,0 +1,108 @@
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+
+from fixtures.databases import TEST_REPLICA
+
+pytestmark = [
+    pytest.mark.django_db(databases=["default", TEST_REPLICA]),
+]
+
+
+@pytest.fixture(autouse=True)
+def route_to_replica():
+    cache.clear()
+    with override_settings(REPLICA_DATABASE=TEST_REPLICA):
+        yield
+    cache.clear()
+
+
+@pytest.fixture
+def primary_only_post(mixer, user, published_category):
+    # Written to `default` only: a replica that has not caught up yet.
+    return mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        pub_date=timezone.now() - timezone.timedelta(hours=1),
+    )
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["/", "/posts/{pk}/", "/category/{slug}/", "/profile/{username}/"],
+)
+def test_feed_and_detail_views_read_replica(
+        another_user_client, primary_only_post, url
+):
+    url = url.format(
+        pk=primary_only_post.pk,
+        slug=primary_only_post.category.slug,
+        username=primary_only_post.author.username,
+    )
+    response = another_user_client.get(url)
+    assert response.status_code == 404 or (
+        primary_only_post.title not in response.content.decode()
+    ), "Убедитесь, что ленты и страницы публикаций читаются из реплики."
+
+
+def test_writer_is_pinned_to_primary(user_client, primary_only_post):
+    from blog.models import Comment
+
+    url = f"/posts/{primary_only_post.pk}/"
+    assert user_client.get(url).status_code == 404
+    response = user_client.post(
+        f"{url}comment/", {"text": "Свежий комментарий"}
+    )
+    assert response.status_code == 302
+    assert Comment.objects.using("default").filter(
+        text="Свежий комментарий"
+    ).exists()
+    response = user_client.get(url)
+    assert response.status_code == 200, (
+        "Убедитесь, что после записи пользователь какое-то время читает"
+        " основную базу и видит свои изменения."
+    )
+    assert "Свежий комментарий" in response.content.decode()
+
+
+def test_other_views_read_primary(user_client, primary_only_post):
+    response = user_client.get(f"/posts/{primary_only_post.pk}/edit/")
+    assert response.status_code == 200
+
+
+def test_anonymous_page_cache_is_filled_from_primary(
+        client, primary_only_post
+):
+    response = client.get("/")
+    assert primary_only_post.title in response.content.decode(), (
+        "Убедитесь, что кешируемые страницы собираются из основной базы:"
+        " отстающая реплика не должна попасть в кеш под новой версией."
+    )
+
+
+def test_cards_rendered_from_replica_are_not_cached(primary_only_post):
+    from blog.cards import CARD_KEY, render_post_card
+    from core.routers import allow_replica_reads, replica_scope
+
+    with replica_scope():
+        allow_replica_reads()
+        render_post_card(primary_only_post)
+    key = CARD_KEY.format(
+        pk=primary_only_post.pk, version=primary_only_post.card_version
+    )
+    assert cache.get(key) is None
+    render_post_card(primary_only_post)
+    assert cache.get(key) is not None
+
+
+def test_lookups_are_loaded_from_primary(
+        another_user_client, primary_only_post
+):
+    category = primary_only_post.category
+    response = another_user_client.get(f"/category/{category.slug}/")
+    assert response.status_code == 200, (
+        "Убедитесь, что кеш категорий заполняется из основной базы, а не"
+        " из отстающей реплики."
+    )
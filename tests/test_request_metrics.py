@@ -0,0 +1,83 @@
+import logging
+import time
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from core.metrics import registry
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    cache.clear()
+    registry.reset()
+    yield
+    registry.reset()
+
+
+RENDER_DELAY = 0.05
+
+
+@pytest.fixture
+def slow_templates(monkeypatch):
+    from django.template.backends.django import Template
+
+    render = Template.render
+
+    def slow_render(self, *args, **kwargs):
+        time.sleep(RENDER_DELAY)
+        return render(self, *args, **kwargs)
+
+    monkeypatch.setattr(Template, "render", slow_render)
+
+
+def test_metrics_recorded_per_view(
+        client, post_with_published_location, slow_templates
+):
+    response = client.get(f"/posts/{post_with_published_location.pk}/")
+    queries = registry.snapshot("blog:post_detail", "queries")
+    assert queries and queries.count == 1 and queries.total > 0, (
+        "Убедитесь, что число запросов к БД учитывается по имени"
+        " представления."
+    )
+    size = registry.snapshot("blog:post_detail", "response_bytes")
+    assert size.total == len(response.content)
+    render = registry.snapshot("blog:post_detail", "render_seconds")
+    assert render and render.total >= RENDER_DELAY, (
+        "Убедитесь, что время рендеринга шаблона измеряется целиком."
+    )
+
+    exported = client.get("/internal/metrics/").content.decode()
+    assert (
+        'blogicum_request_queries_count{view="blog:post_detail"} 1'
+        in exported
+    ), "Убедитесь, что гистограммы доступны на /internal/metrics/."
+
+
+def test_metrics_endpoint_is_internal(client):
+    response = client.get("/internal/metrics/", REMOTE_ADDR="203.0.113.5")
+    assert response.status_code == 404
+
+
+@override_settings(METRICS_ALLOWED_IPS=[], INTERNAL_IPS=["127.0.0.1"])
+def test_metrics_endpoint_ignores_internal_ips(client, mixer):
+    # Behind a reverse proxy every visitor arrives from 127.0.0.1.
+    response = client.get("/internal/metrics/", REMOTE_ADDR="127.0.0.1")
+    assert response.status_code == 404
+    client.force_login(mixer.blend("auth.User", is_staff=True))
+    response = client.get("/internal/metrics/", REMOTE_ADDR="127.0.0.1")
+    assert response.status_code == 200
+
+
+@override_settings(QUERY_BUDGETS={"blog:index": 0})
+def test_budget_overrun_is_logged(client, caplog):
+    with caplog.at_level(logging.WARNING, logger="core.middleware"):
+        client.get("/")
+    assert any(
+        getattr(record, "view_name", None) == "blog:index"
+        for record in caplog.records
+    ), "Убедитесь, что превышение бюджета запросов пишется в лог."
+    assert registry.budget_overruns["blog:index"] == 1
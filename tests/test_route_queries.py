@@ -0,0 +1,137 @@
+"""Query budgets of every named route at growing data sizes.
+
+A count that grows with the data is how an N+1 query shows up, so each
+route is measured on a nearly empty blog and on blogs whose feeds and
+comment threads overflow a page.
+"""
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+DATA_SIZES = (1, 12, 30)
+
+# Maximum queries as (anonymous, logged-in author). Logged-in requests
+# add the session and user lookups; author-only routes redirect anonymous
+# visitors without touching the database.
+ROUTE_QUERIES = {
+    "blog:index": (3, 5),
+    "blog:profile": (4, 6),
+    "blog:post_detail": (3, 5),
+    "blog:post_comments": (3, 5),
+    "blog:category_posts": (4, 6),
+    "blog:search": (3, 5),
+    "blog:create_post": (0, 4),
+    "blog:edit_profile": (0, 5),
+    "blog:edit_post": (0, 5),
+    "blog:delete_post": (0, 3),
+    "blog:add_comment": (0, 2),
+    "blog:edit_comment": (0, 3),
+    "blog:delete_comment": (0, 3),
+    "pages:about": (0, 2),
+    "pages:rules": (0, 2),
+}
+
+
+class Blog:
+    """Grows a blog around one author, post and comment of that author."""
+
+    def __init__(self, mixer, author, category, location):
+        from blog.models import Comment
+
+        self.mixer = mixer
+        self.author = author
+        self.category = category
+        self.location = location
+        self.posts = []
+        self._add_posts(1)
+        self.post = self.posts[0]
+        self.comment = Comment.objects.create(
+            post=self.post, author=author, text="Комментарий автора"
+        )
+
+    def _add_posts(self, n):
+        from blog.models import Post
+
+        start = timezone.now() - timedelta(days=1)
+        for _ in range(n):
+            self.posts.append(
+                Post.objects.create(
+                    title=f"Пост {len(self.posts)}",
+                    text="Текст публикации",
+                    pub_date=start - timedelta(minutes=len(self.posts)),
+                    author=self.author,
+                    category=self.category,
+                    location=self.location,
+                )
+            )
+
+    def grow_to(self, size):
+        from blog.models import Comment, Post
+
+        self._add_posts(size - len(self.posts))
+        commenters = self.mixer.cycle(size).blend("auth.User")
+        Comment.objects.bulk_create(
+            Comment(post=post, author=commenter, text="Комментарий")
+            for post in self.posts
+            for commenter in commenters
+        )
+        Post.objects.recount_comments()
+
+    def url(self, route):
+        values = {
+            "username": self.author.username,
+            "post_id": self.post.pk,
+            "comment_id": self.comment.pk,
+            "category_slug": self.category.slug,
+        }
+        url = reverse(route, kwargs=self._kwargs(route, values))
+        return url + "?q=пост" if route == "blog:search" else url
+
+    @staticmethod
+    def _kwargs(route, values):
+        from blog import urls as blog_urls
+        from pages import urls as pages_urls
+
+        app_name, name = route.split(":")
+        module = {"blog": blog_urls, "pages": pages_urls}[app_name]
+        pattern = next(p for p in module.urlpatterns if p.name == name)
+        return {key: values[key] for key in pattern.pattern.converters}
+
+
+def _count_queries(client, url):
+    cache.clear()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code in (200, 302), (url, response.status_code)
+    return len(queries)
+
+
+@pytest.mark.parametrize("logged_in", [False, True], ids=["anon", "author"])
+@pytest.mark.parametrize("route", list(ROUTE_QUERIES))
+def test_route_query_budget(
+        client, mixer, user, published_category, published_location,
+        route, logged_in
+):
+    if logged_in:
+        client.force_login(user)
+    blog = Blog(mixer, user, published_category, published_location)
+    budget = ROUTE_QUERIES[route][logged_in]
+    counts = []
+    for size in DATA_SIZES:
+        blog.grow_to(size)
+        counts.append(_count_queries(client, blog.url(route)))
+    assert len(set(counts)) == 1, (
+        f"Убедитесь, что число запросов к БД у `{route}` не растёт вместе"
+        f" с числом публикаций и комментариев: {counts}."
+    )
+    assert counts[0] <= budget, (
+        f"Убедитесь, что `{route}` выполняет не больше {budget} запросов"
+        f" к БД, а не {counts[0]}."
+    )
@@ -0,0 +1,86 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _found_ids(client, query, **params):
+    response = client.get("/search/", {"q": query, **params})
+    assert response.status_code == 200
+    return [post.id for post in response.context["page_obj"]]
+
+
+@pytest.fixture
+def search_posts(mixer, user, published_category):
+    published_category.title = "Горный туризм"
+    published_category.save()
+    in_title = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        title="Путешествия по Алтаю", text="Короткая заметка",
+    )
+    in_text = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        title="Заметка", text="Мы долго готовились к путешествию",
+    )
+    hidden = mixer.blend(
+        "blog.Post", author=user, category=published_category,
+        title="Путешествие в черновиках", is_published=False,
+    )
+    return in_title, in_text, hidden
+
+
+def test_search_stems_russian_words_and_ranks_title_first(
+        client, search_posts
+):
+    in_title, in_text, _ = search_posts
+    assert _found_ids(client, "путешествие") == [in_title.id, in_text.id], (
+        "Убедитесь, что поиск находит разные формы русских слов и ставит"
+        " совпадения в заголовке выше совпадений в тексте."
+    )
+
+
+def test_search_respects_visibility(client, search_posts):
+    *_, hidden = search_posts
+    assert hidden.id not in _found_ids(client, "черновиках"), (
+        "Убедитесь, что поиск не показывает снятые с публикации посты."
+    )
+
+
+def test_search_covers_category_titles(client, search_posts):
+    in_title, in_text, _ = search_posts
+    assert set(_found_ids(client, "горные")) == {in_title.id, in_text.id}
+    category = in_title.category
+    category.title = "Морской отдых"
+    category.save()
+    assert _found_ids(client, "горные") == []
+    assert set(_found_ids(client, "морской")) == {in_title.id, in_text.id}
+
+
+def test_search_index_follows_post_changes(client, search_posts):
+    in_title, *_ = search_posts
+    in_title.title = "Рыбалка"
+    in_title.save()
+    assert in_title.id in _found_ids(client, "рыбалку")
+    in_title.delete()
+    assert _found_ids(client, "рыбалку") == []
+
+
+def test_search_ignores_fts_syntax(client, search_posts):
+    assert _found_ids(client, '" OR * NEAR(') == []
+    assert _found_ids(client, "") == []
+
+
+def test_rebuild_search_index(client, user, published_category):
+    from blog.models import Post
+
+    Post.objects.bulk_create([
+        Post(title="Балтика", text="Текст", author=user,
+             category=published_category,
+             pub_date=timezone.now() - timedelta(days=1))
+    ])
+    assert _found_ids(client, "балтика") == []
+    call_command("rebuild_search_index")
+    assert len(_found_ids(client, "балтика")) == 1
@@ -0,0 +1,129 @@
+import pytest
+from PIL import ExifTags, Image
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+
+from blog import thumbnails
+from fixtures.images import image_file
+
+pytestmark = [pytest.mark.django_db, pytest.mark.usefixtures("media_root")]
+
+
+def _image_file(width=1600, height=900, name="photo.jpg"):
+    exif = Image.Exif()
+    exif[ExifTags.Base.Make] = "Camera"
+    return image_file(name, size=(width, height), exif=exif)
+
+
+@pytest.fixture
+def uploaded_post(mixer, user, published_category):
+    return mixer.blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        image=_image_file(),
+    )
+
+
+@pytest.fixture
+def image_post(uploaded_post):
+    call_command("process_image_jobs", once=True, verbosity=0)
+    uploaded_post.refresh_from_db()
+    return uploaded_post
+
+
+def test_upload_is_processed_off_request(client, uploaded_post):
+    from blog.models import ImageJob
+
+    name = uploaded_post.image.name
+    assert not thumbnails.has_thumbnails(name), (
+        "Убедитесь, что изображение не обрабатывается во время запроса."
+    )
+    assert ImageJob.objects.filter(
+        post=uploaded_post, status=ImageJob.Status.PENDING
+    ).exists()
+    content = client.get(f"/posts/{uploaded_post.pk}/").content.decode()
+    assert "data-image-pending" in content, (
+        "Убедитесь, что до окончания обработки вместо изображения"
+        " показывается заглушка."
+    )
+
+    call_command("process_image_jobs", once=True, verbosity=0)
+    assert ImageJob.objects.get(post=uploaded_post).status == "done"
+    with default_storage.open(name) as f:
+        assert not Image.open(f).getexif(), (
+            "Убедитесь, что обработчик удаляет EXIF из изображения."
+        )
+    for width in thumbnails.WIDTHS:
+        for ext in [None, *(ext for ext, _ in thumbnails.MODERN_FORMATS)]:
+            thumb = thumbnails.thumbnail_name(name, width, ext)
+            with default_storage.open(thumb) as f:
+                assert Image.open(f).width == min(width, 1600)
+    content = client.get(f"/posts/{uploaded_post.pk}/").content.decode()
+    assert "data-image-pending" not in content
+
+
+def test_failed_job_is_retried_then_gives_up(monkeypatch, uploaded_post):
+    from blog.models import ImageJob
+
+    def broken(*args, **kwargs):
+        raise OSError("broken image")
+
+    monkeypatch.setattr(thumbnails, "generate_thumbnails", broken)
+    call_command("process_image_jobs", once=True, verbosity=0)
+    job = ImageJob.objects.get(post=uploaded_post)
+    assert job.status == "failed" and "broken image" in job.error
+    assert job.attempts == 3
+    uploaded_post.refresh_from_db()
+    assert uploaded_post.image_ready
+
+
+def test_unstripped_image_stays_hidden_after_last_retry(
+        monkeypatch, client, uploaded_post
+):
+    from blog.models import ImageJob
+
+    def broken(*args, **kwargs):
+        raise OSError("cannot strip")
+
+    monkeypatch.setattr(thumbnails, "strip_metadata", broken)
+    call_command("process_image_jobs", once=True, verbosity=0)
+    job = ImageJob.objects.get(post=uploaded_post)
+    assert job.status == "failed" and job.attempts == 3
+    uploaded_post.refresh_from_db()
+    assert not uploaded_post.image_ready, (
+        "Убедитесь, что изображение, из которого не удалось удалить"
+        " метаданные (EXIF, GPS), не показывается и после всех попыток."
+    )
+    content = client.get(f"/posts/{uploaded_post.pk}/").content.decode()
+    assert uploaded_post.image.url not in content
+
+
+@pytest.mark.parametrize(
+    "url, variant", [("/", "card"), ("/posts/{pk}/", "detail")]
+)
+def test_pages_offer_srcset(client, image_post, url, variant):
+    content = client.get(url.format(pk=image_post.pk)).content.decode()
+    name = image_post.image.name
+    for width in thumbnails.VARIANTS[variant]:
+        for ext in [None, *(ext for ext, _ in thumbnails.MODERN_FORMATS)]:
+            thumb_url = default_storage.url(
+                thumbnails.thumbnail_name(name, width, ext)
+            )
+            assert f"{thumb_url} {width}w" in content, (
+                "Убедитесь, что изображения публикаций выводятся с `srcset`."
+            )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_backfill_command(image_post, workers):
+    name = image_post.image.name
+    for width in thumbnails.WIDTHS:
+        for ext in [None, *(ext for ext, _ in thumbnails.MODERN_FORMATS)]:
+            default_storage.delete(thumbnails.thumbnail_name(name, width, ext))
+    assert not thumbnails.has_thumbnails(name)
+    call_command("generate_thumbnails", workers=workers, verbosity=0)
+    assert thumbnails.has_thumbnails(name), (
+        "Убедитесь, что команда `generate_thumbnails` создаёт недостающие"
+        " копии изображений."
+    )